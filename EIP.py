@@ -13,13 +13,11 @@ Need python packages
 
 from PyQt5.QtWidgets import QApplication
 from Program_Files.gui_app import MainWindow
-from Program_Files.data_handling import load_Inventory
 import sys
 
 
 if __name__ == "__main__":
-    # runnning program
-    load_Inventory()
+    # runnning program, the inventory is loaded by the main window.
     app = QApplication(sys.argv)
     window1 = MainWindow()
     app.exec_()
@@ -6,64 +6,618 @@ This script uses the pandas module to handle the data.
 
 import pandas as pd
 import numpy as np
+import sqlite3
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+import zipfile
+import hashlib
+import pickle
+import json
+import re
 import os
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, chain
+
+try:
+    # optional, used to save the inventory snapshot as a feather file.
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 labels = ['Digi-Key Part #', 'Manufacturer Part Number',
           'Description', 'Customer Reference', 'Unit Price', 'Quantity']
 
+# column of the category an item belongs to.
+category_column = 'Category'
+# column of the lowercase words of the description, split once when items are added (see get_words()).
+words_column = 'Description Words'
+
+# xml namespaces and characters not allowed in excel files (used to rewrite sheets).
+excel_namespaces = {
+    'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'relationships': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+}
+excel_illegal_chars = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# values read from the (uppercase) descriptions, i.e: RES 1K OHM 1% 1/8W 0805 (see get_parameters()).
+# numbers can't follow letters, so part codes like SOD123F aren't read as values.
+value_pattern = re.compile(
+    r'(?<![\w./])(\d+(?:\.\d+)?)(?:/(\d+))?\s?([PNUMKG]?)(\s?)(OHMS?|Ω|F|H|VDC|VAC|V|W|%)(?!\w)')
+package_pattern = re.compile(
+    r'(?<![\w./])(0201|0402|0603|0805|1206|1210|1812|2010|2512|D2PAK|DPAK|AXIAL|RADIAL|'
+    r'(?:SOT|SOD|TO|DO)-?\d+[A-Z]*(?:-\d+)?|\d+-?(?:DIP|SOIC|SOP|SSOP|TSSOP|MSOP|QFN|TQFP|QFP|SIP))(?!\w)')
+unit_columns = {'OHM': 'Ohms', 'OHMS': 'Ohms', 'Ω': 'Ohms', 'F': 'Farads', 'H': 'Henries',
+                'V': 'Volts', 'VDC': 'Volts', 'VAC': 'Volts', 'W': 'Watts', '%': 'Tolerance %'}
+# prefixes each unit can have, i.e: 320GF is grams not farads.
+column_prefixes = {'Ohms': 'KMG', 'Farads': 'PNUM', 'Henries': 'PNUM',
+                   'Volts': 'MK', 'Watts': 'MK', 'Tolerance %': ''}
+unit_prefixes = {'': 1, 'P': 1e-12, 'N': 1e-9,
+                 'U': 1e-6, 'M': 1e-3, 'K': 1e3, 'G': 1e9}
+parameter_columns = ['Ohms', 'Farads', 'Henries',
+                     'Volts', 'Watts', 'Tolerance %', 'Package']
+# columns read from the description of items (see get_description_columns()).
+description_columns = [words_column] + parameter_columns
+
+
+
+def get_words(descriptions: pd.Series) -> pd.Series:
+    '''
+    Function to get the lowercase words of descriptions, separated by single spaces.
+    Each different description is only split once.
+
+        Parameters:
+            descriptions: Serie of descriptions.
+
+        Returns:
+            Serie of words, same index as the descriptions.
+    '''
+    rows, unique = pd.factorize(descriptions.fillna('').astype(str))
+    words = np.array([' '.join(description.lower().split())
+                     for description in unique], dtype=object)
+    return pd.Series(words[rows], index=descriptions.index, dtype=object)
+
+
+def get_item_words(items: pd.DataFrame) -> pd.Series:
+    '''
+    Function to get the words of the descriptions of items, using their 'Description Words'
+    column. Items without words (i.e: inventory items put together with an order) are split.
+
+        Parameters:
+            items: DataFrame of items.
+
+        Returns:
+            Serie of words, same index as the items.
+    '''
+    if words_column not in items:
+        return get_words(items['Description'])
+
+    words = items[words_column].to_numpy(dtype=object)
+    missing = pd.isna(words)
+    if missing.any():
+        words = words.copy()
+        words[missing] = get_words(items['Description'][missing]).to_numpy()
+    return pd.Series(words, index=items.index, dtype=object)
+
+
+def description_words(descriptions: list) -> tuple:
+    '''
+    Function to give each word of descriptions a code, (used to sort items).
+
+        Parameters:
+            descriptions: list of descriptions split into lowercase words.
+
+        Returns:
+            tuple: number of words in each description, code of each word
+                   (one description after another), unique words.
+    '''
+    lengths = np.array([len(line) for line in descriptions], dtype=int)
+    codes, words = pd.factorize(
+        np.array(list(chain.from_iterable(descriptions)), dtype=object))
+    return lengths, codes, words
+
+
+class KeywordMatcher:
+    '''
+    Aho-Corasick matcher, finds every keyword in a text in a single scan of the text,
+    however many keywords there are. Used by the category rules ("contains") and the search.
+
+    Attributes:
+        keywords: list of keywords (lowercase) to find.
+    '''
+
+    def __init__(self, keywords: list) -> None:
+        self.keywords = [keyword.lower() for keyword in keywords]
+        # state transitions, keywords found at each state and the fallback state.
+        self.transitions = [{}]
+        self.found = [set()]
+        fallback = [0]
+
+        for i, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                if char not in self.transitions[state]:
+                    self.transitions.append({})
+                    self.found.append(set())
+                    fallback.append(0)
+                    self.transitions[state][char] = len(self.transitions) - 1
+                state = self.transitions[state][char]
+            self.found[state].add(i)
+
+        # breadth first, so the fallback of a state is done before the states after it.
+        # missing transitions are filled in from the fallback, so scanning a text is one
+        # dictionary lookup per character.
+        queue = list(self.transitions[0].values())
+        for state in queue:
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                if state:
+                    fallback[next_state] = self.transitions[fallback[state]].get(char, 0)
+                    self.found[next_state] |= self.found[fallback[next_state]]
+            if state:
+                for char, next_state in self.transitions[fallback[state]].items():
+                    self.transitions[state].setdefault(char, next_state)
+
+    def find(self, text: str) -> set:
+        '''
+        Function to find the keywords in a text.
+
+            Parameters:
+                text: lowercase text to look in.
+
+            Returns:
+                set of the positions of the keywords found.
+        '''
+        transitions, found = self.transitions, self.found
+        keywords = set(found[0])  # empty keywords are in every text.
+        state = 0
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if found[state]:
+                keywords |= found[state]
+        return keywords
+
+    def find_rows(self, texts: pd.Series, lowercase=False) -> np.ndarray:
+        '''
+        Function to find which texts have each keyword, (not case sensitive).
+
+            Parameters:
+                texts: Series of texts (i.e: item descriptions), missing texts have no keywords.
+                lowercase: True if the texts are already lowercase (i.e: description words).
+
+            Returns:
+                boolean array, a row for each keyword and a column for each text.
+        '''
+        rows, texts = pd.factorize(texts, use_na_sentinel=True)
+        if not lowercase:
+            texts = [str(text).lower() for text in texts]
+        matches = np.zeros((len(self.keywords), len(texts) + 1), dtype=bool)
+        for i, text in enumerate(texts):
+            for keyword in self.find(text):
+                matches[keyword, i] = True
+        # the last column is for missing texts (code -1).
+        return matches[:, rows]
+
+
+class CategoryRules:
+    '''
+    Rules to sort items into categories by the words in their description, (see category_rules.json).
+
+    The rule file has the categories (in the order of the inventory), the default category
+    and the rules. Rules are checked in the order listed, the first rule an item matches is
+    its category. A rule matches if the description has:
+        "any": any of the words,
+        "all": all of the words,
+        "contains": a word containing any of the texts,
+    (a rule can have more than one, all of them need to match). A rule can have
+    "rules" of its own, checked first for the items matching it (i.e: Logic Gates in ICs).
+
+    The rules are compiled into a lookup table of word to bit mask, each condition being a bit,
+    so a description is checked with one dictionary lookup per word.
+
+    The category of each description is kept in a LRU cache (shared by everything sorting
+    items), so descriptions seen before are not checked again. The cache is cleared when
+    the rules are loaded.
+
+    Profiling can be turned on (see start_profiling()) to see how many items each
+    rule catches, how long each rule takes and which descriptions end up in the default category.
+
+    Attributes:
+        filepath: path of the rule file.
+        categories: list of category names.
+        cache_size: number of descriptions kept in the cache.
+    '''
+
+    def __init__(self, filepath: str, cache_size=100000) -> None:
+        self.filepath = filepath
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # normalized description: (category position, rule position).
+        self.cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.profile = None  # profiling results, None when not profiling.
+        self.categories = None
+        self.load()
+
+    def load(self) -> None:
+        '''
+        Function to load and compile the rule file, (call again to reload the rules).
+
+        The categories can't change once loaded since the items are split by them (see Data),
+        a ValueError is raised and the current rules are kept.
+        '''
+        with open(self.filepath) as file:
+            text = file.read()
+        rules = json.loads(text)
+        categories = list(rules['categories'])
+        if self.categories is not None and categories != self.categories:
+            raise ValueError(
+                f'The categories in {self.filepath} changed, restart the program to use them.')
+        # orders sorted with other rules are not reused (see OrderCache).
+        self.rules_hash = hashlib.sha256(text.encode()).hexdigest()
+
+        with self.cache_lock:
+            self.cache.clear()
+
+        self.categories = categories
+        self.default = self.get_position(rules['default'])
+        self.word_bits = {}  # word: bit mask of the conditions with that word.
+        self.contains_bits = []  # (text, bit mask of the conditions with that text).
+        self.rule_masks = []  # bit mask of the conditions of each rule.
+        self.rule_categories = []  # category position of each rule.
+        self.rule_names = []  # description of each rule, (used when profiling).
+        self.bit_count = 0
+        self.compile(rules['rules'])
+        # finds the "contains" texts in a word in a single scan.
+        self.contains_matcher = KeywordMatcher(
+            [text for text, _ in self.contains_bits])
+        if self.profile is not None:
+            self.start_profiling()
+
+    def get_position(self, category: str) -> int:
+        '''
+        Function to get the position of a category.
+        '''
+        if category not in self.categories:
+            raise ValueError(
+                f'"{category}" is not in the categories of {self.filepath}.')
+        return self.categories.index(category)
+
+    def new_bit(self) -> int:
+        '''
+        Function to get the bit for a new condition.
+        '''
+        if self.bit_count == 64:
+            raise ValueError(f'{self.filepath} has more than 64 conditions.')
+        self.bit_count += 1
+        return 1 << (self.bit_count - 1)
+
+    def add_words(self, words: list, bit: int) -> None:
+        '''
+        Function to add words to the lookup table.
+        '''
+        for word in words:
+            word = word.lower()
+            if len(word.split()) != 1:
+                raise ValueError(
+                    f'"{word}" in {self.filepath} is not a single word.')
+            self.word_bits[word] = self.word_bits.get(word, 0) | bit
+
+    def compile(self, rules: list, parent_mask=0, parent_name='') -> None:
+        '''
+        Function to compile rules, (sub-rules are placed before their rule).
+
+            Parameters:
+                rules: list of rules from the rule file.
+                parent_mask: bit mask of the conditions of the rule these rules are in.
+                parent_name: description of the rule these rules are in.
+        '''
+        for rule in rules:
+            name = parent_name + rule['category'] + ': ' + ', '.join(
+                f'{condition} {rule[condition]}' for condition in ['any', 'all', 'contains']
+                if rule.get(condition))
+            mask = parent_mask
+            if rule.get('any'):
+                bit = self.new_bit()
+                self.add_words(rule['any'], bit)
+                mask |= bit
+            for word in rule.get('all', []):
+                bit = self.new_bit()
+                self.add_words([word], bit)
+                mask |= bit
+            if rule.get('contains'):
+                bit = self.new_bit()
+                self.contains_bits.extend(
+                    (text.lower(), bit) for text in rule['contains'])
+                mask |= bit
+
+            self.compile(rule.get('rules', []), mask, name + ' > ')
+            self.rule_masks.append(mask)
+            self.rule_categories.append(self.get_position(rule['category']))
+            self.rule_names.append(name)
+
+    def get_word_bits(self, word: str) -> int:
+        '''
+        Function to get the bit mask of the conditions a word matches.
+        '''
+        bits = self.word_bits.get(word, 0)
+        for i in self.contains_matcher.find(word):
+            bits |= self.contains_bits[i][1]
+        return bits
+
+    def get_cache_info(self) -> dict:
+        '''
+        Function to get how well the cache is working.
+
+            Returns:
+                dict: {'hits': int, 'misses': int, 'size': int, 'max_size': int}
+        '''
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self.cache), 'max_size': self.cache_size}
+
+    def classify(self, descriptions: pd.Series) -> np.ndarray:
+        '''
+        Function to get the category of items from their descriptions.
+
+            Parameters:
+                descriptions: Series of item descriptions.
+
+            Returns:
+                array of the position of each item's category (see categories).
+        '''
+        # the descriptions are only factorized once, the rows go straight to their words.
+        rows, unique = pd.factorize(descriptions.fillna('').astype(str))
+        keys = [' '.join(description.lower().split()) for description in unique]
+        return self.classify_keys(rows, keys)
+
+    def classify_words(self, words: pd.Series) -> np.ndarray:
+        '''
+        Function to get the category of items from the words of their descriptions, (see get_words()).
+
+            Parameters:
+                words: Series of the lowercase words of item descriptions.
+
+            Returns:
+                array of the position of each item's category (see categories).
+        '''
+        rows, keys = pd.factorize(words.fillna(''))
+        return self.classify_keys(rows, keys.tolist())
+
+    def classify_keys(self, rows: np.ndarray, keys: list) -> np.ndarray:
+        '''
+        Function to get the category of items from the words of their different descriptions.
+
+            Parameters:
+                rows: array of the position of each item's words in keys.
+                keys: list of the lowercase words of each different description.
+
+            Returns:
+                array of the position of each item's category (see categories).
+        '''
+        # only the words are used to sort, so that is what is cached.
+        categories = np.zeros(len(keys), dtype=int)
+        rules = np.full(len(keys), -1, dtype=int)
+        misses = []
+        with self.cache_lock:
+            for i, key in enumerate(keys):
+                cached = self.cache.get(key)
+                if cached is None:
+                    misses.append(i)
+                else:
+                    self.cache.move_to_end(key)
+                    categories[i], rules[i] = cached
+            self.hits += len(keys) - len(misses)
+            self.misses += len(misses)
+
+        if misses:
+            found, found_rules = self.match([keys[i].split() for i in misses])
+            categories[misses] = found
+            rules[misses] = found_rules
+            with self.cache_lock:
+                for i, category, rule in zip(misses, found, found_rules):
+                    self.cache[keys[i]] = (int(category), int(rule))
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+
+        if self.profile is not None:
+            self.profile_items(rules, np.bincount(rows, minlength=len(keys)), keys)
+        return categories[rows]
+
+    def match(self, descriptions: list) -> np.ndarray:
+        '''
+        Function to check the rules for descriptions, (see classify()).
+
+            Parameters:
+                descriptions: list of descriptions split into lowercase words.
+
+            Returns:
+                tuple: array of the position of each description's category,
+                       array of the position of the rule that matched (-1 for the default category).
+        '''
+        start = time.perf_counter()
+        lengths, codes, words = description_words(descriptions)
+        word_bits = np.array([self.get_word_bits(word) for word in words],
+                             dtype=np.uint64)
+
+        # conditions matched by the words of each description.
+        bits = np.zeros(len(lengths), dtype=np.uint64)
+        has_words = lengths > 0
+        if has_words.any():
+            starts = np.cumsum(lengths) - lengths
+            bits[has_words] = np.bitwise_or.reduceat(
+                word_bits[codes], starts[has_words])
+
+        masks = np.array(self.rule_masks, dtype=np.uint64)
+        if self.profile is None:
+            matches = [(bits & mask) == mask for mask in masks]
+        else:
+            self.profile['lookup_seconds'] += time.perf_counter() - start
+            matches = self.profile_rules(bits, masks, descriptions)
+
+        # the first rule a description matches is the one that caught it.
+        rules = np.select(matches, np.arange(len(masks)), default=-1)
+        categories = np.append(np.array(self.rule_categories, dtype=int), self.default)[rules]
+        return categories, rules
+
+    def start_profiling(self, samples=100) -> None:
+        '''
+        Function to start (or restart) profiling the rules. The cache is cleared so
+        every description is checked by the rules.
+
+            Parameters:
+                samples: number of descriptions in the default category to keep.
+        '''
+        with self.cache_lock:
+            self.cache.clear()
+        self.profile = {
+            'items': 0,
+            'descriptions': 0,
+            'lookup_seconds': 0.0,
+            'rule_hits': [0] * len(self.rule_masks),
+            'rule_seconds': [0.0] * len(self.rule_masks),
+            'default_count': 0,
+            'default_samples': [],
+            'samples': samples,
+        }
+
+    def stop_profiling(self) -> None:
+        '''
+        Function to stop profiling the rules.
+        '''
+        self.profile = None
+
+    def profile_rules(self, bits: np.ndarray, masks: np.ndarray, descriptions: list) -> list:
+        '''
+        Function to check each rule while timing it.
+
+            Parameters:
+                bits: bit mask of the conditions matched by each description.
+                masks: bit mask of the conditions of each rule.
+                descriptions: list of descriptions split into lowercase words.
+
+            Returns:
+                list of boolean arrays, the descriptions each rule matches.
+        '''
+        profile = self.profile
+        matches = []
+        for i, mask in enumerate(masks):
+            start = time.perf_counter()
+            matches.append((bits & mask) == mask)
+            profile['rule_seconds'][i] += time.perf_counter() - start
+        profile['descriptions'] += len(descriptions)
+        return matches
+
+    def profile_items(self, rules: np.ndarray, counts: np.ndarray, keys: np.ndarray) -> None:
+        '''
+        Function to record how many items each rule caught, (items from the cache included).
+
+            Parameters:
+                rules: position of the rule that caught each description (-1 for the default category).
+                counts: number of items with each description.
+                keys: lowercase words of each description.
+        '''
+        profile = self.profile
+        caught = rules >= 0
+        hits = np.bincount(rules[caught], weights=counts[caught],
+                           minlength=len(self.rule_masks))
+        for i, count in enumerate(hits):
+            profile['rule_hits'][i] += int(count)
+
+        profile['items'] += int(counts.sum())
+        default = np.flatnonzero(~caught)
+        profile['default_count'] += int(counts[default].sum())
+        for i in default:
+            if len(profile['default_samples']) >= profile['samples']:
+                break
+            if keys[i] not in profile['default_samples']:
+                profile['default_samples'].append(keys[i])
+
+    def get_profile(self) -> dict:
+        '''
+        Function to get the profiling results, (see start_profiling()).
+
+            Returns:
+                dict of the results, rules sorted by how many items they caught.
+        '''
+        if self.profile is None:
+            return {}
+
+        profile = self.profile
+        rules = [
+            {'rule': name, 'order': i + 1, 'hits': profile['rule_hits'][i],
+             'seconds': round(profile['rule_seconds'][i], 6)}
+            for i, name in enumerate(self.rule_names)
+        ]
+        rules.sort(key=lambda rule: rule['hits'], reverse=True)
+        return {
+            'items': profile['items'],
+            'descriptions': profile['descriptions'],
+            'lookup_seconds': round(profile['lookup_seconds'], 6),
+            'rules': rules,
+            self.categories[self.default]: {
+                'count': profile['default_count'],
+                'samples': profile['default_samples'],
+            },
+            'cache': self.get_cache_info(),
+        }
+
+    def save_profile(self, filepath: str) -> None:
+        '''
+        Function to save the profiling results to a json file.
+
+            Parameters:
+                filepath: filepath of the json file.
+        '''
+        with open(filepath, 'w') as file:
+            json.dump(self.get_profile(), file, indent=4)
+
 
 '''
 creating dictionary of Category classes for the inventory.
 
-Rememeber when adding new categories to add the nessecary conditions
-in sort_order().
-
+The categories and how items are sorted into them are in category_rules.json.
 '''
-dict_keys = [
-    'Resistors',
-    'Capacitors',
-    'Inductors',
-    'Transistors',
-    'Diodes',
-    'Regulator',
-    'ICs',
-    "Logic Gates",
-    'Connectors',
-    'Displays',
-    'Buttons, Switches',
-    'LEDs',
-    'Audio',
-    'Potentiometer',
-    'Modules',
-    'Fans',
-    'ACDC Converters',
-    'AC Transformer',
-    'Resonators, Crystals',
-    'Encoders',
-    'Relay',
-    'Other'
-]
+category_rules = CategoryRules(
+    os.path.join(os.path.dirname(__file__), 'category_rules.json'))
+dict_keys = category_rules.categories
 
 
 class Category:
     '''
     Catergory Class for electronic part.
 
+    The items are not stored in the Category, they are a slice of the single
+    columnar frame kept by a Data object, so getting the items does not copy them.
+
     Attributes:
         category: what type of category. Ex: Resistors, Capacitors...
+        data: Data object that stores the items (default creates its own).
     '''
 
-    def __init__(self, category: str) -> None:
-        # dataframe to store the data.
-        self.items = pd.DataFrame()
+    def __init__(self, category: str, data=None) -> None:
         # type of component, i.e: Resistors, Capacitors, etc.
         self.category = category
+        # Data object holding the items of every category.
+        self.data = data if data is not None else Data([category])
+        # changes to the items, and the version when last saved.
+        self.version = 0
+        self.saved_version = 0
+
+    @property
+    def items(self) -> pd.DataFrame:
+        return self.get_items()
 
     def get_items(self) -> pd.DataFrame:
         '''
         Function to return dataframe of Category's items.
+
+        The dataframe is a view into the Data's frame, the index are the row ids.
         '''
-        return self.items
+        items = self.data.items  # adds any buffered rows first.
+        start, stop = self.data.bounds[self.category]
+        return items.iloc[start:stop]
 
     def get_category(self) -> str:
         '''
@@ -71,47 +625,20 @@ class Category:
         '''
         return self.category
 
+    def is_changed(self) -> bool:
+        '''
+        Function to check if the items changed since the last save.
+        '''
+        return self.version != self.saved_version
+
     def add_item(self, items: pd.DataFrame | list | pd.Series) -> None:
         '''
         Function to add items to category.
         'items' can be a dataframe, list of Series, or a single Serie of item(s).
-        '''
 
-        # checking if 'items' is a Series, list or a dataframe.
-        if type(items) == pd.Series:
-            self.items = pd.concat([
-                self.items,
-                pd.DataFrame(items).T
-            ]).reset_index(drop=True)
-        elif type(items) == list:
-            self.items = pd.concat([
-                self.items,
-                pd.DataFrame(items)
-            ]).reset_index(drop=True)
-        elif type(items) == pd.DataFrame:
-            self.items = pd.concat([
-                self.items,
-                items
-            ]).reset_index(drop=True)
-
-        # updating item some descriptions
-        update_dict = {
-            'RES': 'Resistor',
-            'CAP': 'Capacitor',
-            'IND': 'Inductor',
-            'TRANS NPN': "TRANSISTOR NPN",
-            'TRANS PNP': "TRANSISTOR PNP"
-        }
-        # for key, value in update_dict.items():
-        #     self.items['Description'] = self.items['Description'].str.replace(
-        #         key, value.upper(), case=False, n=1)
-
-        # Changing the datatype of 'Quantity' and 'Unit Price'.
-        # (Fixes bugs in later code)
-        self.items['Quantity'] = self.get_items()[
-            'Quantity'].astype(float)
-        self.get_items()['Unit Price'] = self.get_items()[
-            'Unit Price'].astype(float)
+        The items are buffered and added to the frame on the next read (see Data.flush()).
+        '''
+        self.data.add_item(items, self.category)
 
     def remove_duplicates(self, update_info=True) -> None:
         '''
@@ -119,28 +646,8 @@ class Category:
 
         Parameters:
             update_quantity - bool, default True: if "False" doesn't update quantities and unit prices.
-
-        Made using ChatGPT.
         '''
-        self.get_items().sort_values(
-            [labels[0], 'Unit Price'], ascending=[True, False], inplace=True)
-
-        # whether to update the quantity and unit price, default - True.
-        if update_info:
-            self.get_items()['Quantity'] = self.get_items().groupby(
-                labels[0])['Quantity'].transform('sum')
-            self.get_items()['Unit Price'] = self.get_items().groupby(
-                labels[0])['Unit Price'].transform('max')
-
-        self.get_items().drop_duplicates(
-            # Dropping duplicates based on DigiKey part #.
-            subset=labels[0],
-            keep='first',
-            inplace=True)
-        self.get_items().reset_index(inplace=True)
-        self.get_items().sort_values('index', inplace=True)
-        self.get_items().reset_index(drop=True, inplace=True)
-        self.get_items().drop(columns=['index'], inplace=True)
+        self.data.remove_duplicates(self.category, update_info)
 
     def save_toexcel(self, writer=None) -> None:
         '''
@@ -151,13 +658,12 @@ class Category:
             writer - pd.ExcelWriter default none:
                      only pass 'writer' when saving in a group of other sheets.
         '''
+        items = self.get_items()[labels]
         if writer:
-            if self.items.empty:
-                self.items = pd.DataFrame(columns=labels)
-            self.items.to_excel(writer, sheet_name=self.category, index=False)
+            items.to_excel(writer, sheet_name=self.category, index=False)
         else:
             with pd.ExcelWriter(f'Saved_Files/{self.category}.xlsx') as writer:
-                self.items.to_excel(
+                items.to_excel(
                     writer,
                     sheet_name=self.category,
                     index=False
@@ -173,7 +679,7 @@ class Category:
         if group:
             return self.get_items()
         else:
-            _ = self.get_items().to_csv(
+            _ = self.get_items()[labels].to_csv(
                 f'Saved Filed/{self.get_category()}.csv')
 
     def get_sorted_quantity(self, ascending=True) -> pd.DataFrame:
@@ -210,7 +716,16 @@ class Category:
         '''
         Function to drop all items in the dataframe.
         '''
-        self.items.drop(self.items.index, inplace=True)
+        self.data.replace_section(self.category, self.get_items().iloc[:0])
+
+    def get_totals(self) -> dict:
+        '''
+        Function to get the number of items, total quantity and total value of the category.
+
+            Returns:
+                dict: {'count': int, 'quantity': float, 'value': float}
+        '''
+        return self.data.get_totals(self.category)
 
     def get_subtotal(self) -> float:
         '''
@@ -219,11 +734,7 @@ class Category:
             Returns:
                 float
         '''
-        subtotal = 0
-        for i in range(self.items.shape[0]):
-            subtotal += float(self.items.iloc[i]['Quantity']) * \
-                float(self.items.iloc[i]['Unit Price'])
-        return subtotal
+        return self.get_totals()['value']
 
 
 '''
@@ -233,121 +744,670 @@ dictionary used a temporary holder for opening files.
 # Items = {key: Category(key) for key in Inventory.keys()}
 
 
+def get_parameters(descriptions: pd.Series) -> pd.DataFrame:
+    '''
+    Function to read the values in descriptions into numeric columns, (see 'value_pattern').
+    i.e: RES 1K OHM 1% 1/8W 0805 -> Ohms 1000, Tolerance % 1, Watts 0.125, Package 0805.
+
+    Each different description is only read once, the first value of each unit is used
+    and values not found are NaN.
+
+        Parameters:
+            descriptions: Serie of descriptions.
+
+        Returns:
+            DataFrame of the 'parameter_columns', same index as the descriptions.
+    '''
+    rows, unique = pd.factorize(descriptions.fillna('').astype(str).str.upper())
+    unique = pd.Series(unique, dtype=object)
+
+    # every value found, i.e: ('1', '', 'K', ' ', 'OHM'), in a single scan of the descriptions.
+    found = unique.str.findall(value_pattern).explode().dropna()
+    values = pd.DataFrame(found.tolist(), index=found.index,
+                          columns=['number', 'divisor', 'prefix', 'space', 'unit'])
+    values['column'] = values['unit'].map(unit_columns)
+    values = values[np.array([prefix in column_prefixes[column] for prefix, column
+                              in zip(values['prefix'], values['column'])], dtype=bool)]
+
+    multiplier = values['prefix'].map(unit_prefixes)
+    # digikey writes megaohms "1M OHM" and milliohms "75 MOHM".
+    multiplier[(values['column'] == 'Ohms') & (values['prefix'] == 'M') & (values['space'] == ' ')] = 1e6
+    # fractions, i.e: 1/8W
+    divisor = values['divisor'].replace('', '1').astype(float)
+    values['value'] = values['number'].astype(float) / divisor * multiplier
+
+    values = values.rename_axis('row').reset_index().drop_duplicates(['row', 'column'])
+    parameters = values.pivot(index='row', columns='column', values='value').reindex(
+        index=unique.index, columns=parameter_columns[:-1]).astype(float)
+    parameters['Package'] = unique.str.extract(package_pattern)[0]
+
+    parameters = parameters.iloc[rows]
+    parameters.index = descriptions.index
+    parameters.columns.name = None
+    return parameters
+
+
+def get_description_columns(descriptions: pd.Series) -> pd.DataFrame:
+    '''
+    Function to get the columns read from descriptions, the words and the parameters
+    (see get_words() and get_parameters()).
+
+        Parameters:
+            descriptions: Serie of descriptions.
+
+        Returns:
+            DataFrame of the 'description_columns', same index as the descriptions.
+    '''
+    columns = get_parameters(descriptions)
+    columns.insert(0, words_column, get_words(descriptions))
+    return columns
+
+
+def to_item_frame(items: pd.DataFrame | list | pd.Series) -> pd.DataFrame:
+    '''
+    Function to convert item(s) into a dataframe with the 'labels' and 'description_columns' columns.
+
+    'Quantity' and 'Unit Price' are changed to floats (Fixes bugs in later code).
+    The description columns are read from the descriptions, unless the items already have them.
+
+        Parameters:
+            items: Dataframe, list of Series, or single Serie of items.
+
+        Returns:
+            DataFrame
+    '''
+    if type(items) == pd.Series:
+        items = pd.DataFrame(items).T
+    elif type(items) == list:
+        items = pd.DataFrame(items)
+
+    if set(description_columns).issubset(items.columns):
+        items = items.reindex(columns=labels + description_columns)
+    else:
+        items = items.reindex(columns=labels)
+        items[description_columns] = get_description_columns(
+            items['Description'])
+    items['Quantity'] = items['Quantity'].astype(float)
+    items['Unit Price'] = items['Unit Price'].astype(float)
+    return items
+
+
+def combine_duplicates(items: pd.DataFrame, keys: list, update_info=True) -> tuple:
+    '''
+    Function to combine duplicate items in a single pass (one groupby).
+
+    The item with the highest unit price is kept, its quantity is the sum of the
+    duplicates. Items stay in the order of their row ids.
+
+        Parameters:
+            items: DataFrame of items, index are the row ids.
+            keys: columns that are the same for duplicates, i.e: [Category, Digi-Key Part #].
+            update_info: if False doesn't update quantities and unit prices.
+
+        Returns:
+            tuple: DataFrame of items left, row ids of the items that had duplicates.
+    '''
+    # items without a price are only kept if none of their duplicates have one.
+    prices = items['Unit Price'].fillna(-np.inf).rename('Price Rank')
+    totals = pd.concat([items, prices], axis=1).groupby(
+        keys, sort=False, dropna=False, observed=True).agg(
+            row_id=('Price Rank', 'idxmax'),
+            count=('Price Rank', 'size'),
+            quantity=('Quantity', 'sum'),
+            price=('Unit Price', 'max'))
+
+    kept = items.loc[totals['row_id'].to_numpy()]
+    if update_info:
+        kept['Quantity'] = totals['quantity'].to_numpy()
+        kept['Unit Price'] = totals['price'].to_numpy()
+    kept = kept.sort_index()
+    return kept, pd.Index(totals.loc[totals['count'] > 1, 'row_id'])
+
+
 class Data:
-    def __init__(self, sections: list):
+    def __init__(self, sections: list, storage=None):
         '''
+        All the items are kept in one frame, with a categorical 'Category' column.
+        The frame is kept grouped by category (in the order of 'sections'), so each
+        Category is a slice of the frame. The index of the frame are row ids.
+
             Parameters:
                 sections: list of category names.
+                storage: ExcelStorage or SQLiteStorage to load/save the data (default none).
         '''
         self.sections = sections
-        self.data = {section: Category(section) for section in sections}
-
-    def get_sections(self) -> list:
+        self.storage = storage
+        # row ids that were added/changed or deleted since the last save.
+        self.changed_rows = set()
+        self.deleted_rows = set()
+        self.category_dtype = pd.CategoricalDtype(sections, ordered=True)
+        self.next_row_id = 0  # id given to the next item added.
+        # rows added but not in the frame yet, (see flush()).
+        self.pending_rows = []
+        self.items = self.empty_frame()
+        # hash indexes of part numbers to row ids.
+        self.part_index = {}
+        self.manufacturer_index = {}
+        self.bounds = {section: (0, 0) for section in sections}
+        # item count, total quantity and total value of each category, (see update_totals()).
+        self.totals = np.zeros((len(sections), 3))
+        self.data = {section: Category(section, self) for section in sections}
+
+    @property
+    def items(self) -> pd.DataFrame:
+        self.flush()
+        return self._items
+
+    @items.setter
+    def items(self, items: pd.DataFrame) -> None:
+        self._items = items
+
+    def flush(self) -> None:
         '''
-        Function to get the avaliable category.
+        Function to add the buffered items to the frame.
 
-            Returns:
-                list of cateogory names.
+        Items are only given row ids when added, the rows are made (only the new rows
+        are coerced) and concatenated to the frame all at once here, so adding items
+        one at a time does not copy the frame each time. Called when the frame is read.
         '''
-        return self.sections
-
-    def get_data(self, section='all') -> pd.DataFrame:
+        if not self.pending_rows:
+            return
+        pending, self.pending_rows = self.pending_rows, []
+
+        rows = []
+        for is_serie, group in groupby(pending, key=lambda entry: type(entry[0]) == pd.Series):
+            group = list(group)
+            if is_serie:
+                # single items added in a row are made into one frame.
+                items = pd.DataFrame([items for items, _, _ in group])
+                sections = [section for _, section, _ in group]
+                row_ids = [row_ids[0] for _, _, row_ids in group]
+                rows.append(self.new_rows(items, sections, row_ids))
+            else:
+                rows.extend(self.new_rows(*entry) for entry in group)
+        for df in rows:
+            self.index_rows(df)
+            self.update_totals(df)
+
+        frames = [df for df in [self._items, *rows] if not df.empty]
+        # stable sort, added rows stay after the rows already in their category.
+        self._items = pd.concat(frames).sort_values(
+            category_column, kind='stable')
+        self.update_bounds()
+
+    def empty_frame(self) -> pd.DataFrame:
         '''
-        Function to get the data
-
-            Parameters:
-                section: category name to get items from.
+        Function to get an empty frame with the columns and datatypes of the data.
         '''
-        if section == 'all':
-            return self.to_dataframe()
-        else:
-            return self.data[section].get_items()
+        items = to_item_frame(pd.DataFrame(columns=labels))
+        items[category_column] = pd.Series(dtype=self.category_dtype)
+        return items
 
-    def add_item(self, items: pd.DataFrame | list | pd.Series, section: str) -> None:
+    def update_totals(self, rows: pd.DataFrame, sign=1) -> None:
         '''
-        Function to add items to the data dictionary.
+        Function to update the totals of each category by the rows added, (or removed).
+        Missing quantities and prices count as 0.
 
             Parameters:
-                key: what category to add items to.
-                items: Dataframe, list of Series, or single Serie of items.
+                rows: DataFrame of items with a 'Category' column.
+                sign: 1 when adding the rows, -1 when removing them.
         '''
-        self.data[section].add_item(items)
-
-    def remove_duplicates(self, section='all', update_info=True) -> None:
+        if rows.empty:
+            return
+
+        codes = rows[category_column].cat.codes.to_numpy()
+        quantity = np.nan_to_num(rows['Quantity'].to_numpy(dtype=float))
+        value = quantity * \
+            np.nan_to_num(rows['Unit Price'].to_numpy(dtype=float))
+        count = len(self.sections)
+        self.totals += sign * np.column_stack([
+            np.bincount(codes, minlength=count),
+            np.bincount(codes, weights=quantity, minlength=count),
+            np.bincount(codes, weights=value, minlength=count)
+        ])
+        # no rounding errors left over in empty categories.
+        self.totals[self.totals[:, 0] == 0] = 0
+
+    def get_totals(self, section='all') -> dict:
         '''
-        Function to remove duplicates (Part Number) and can update the quantities and unit prices of items.
+        Function to get the number of items, total quantity and total value.
 
-        Parameters:
-            section: what section to remove duplicates from, (default all).
-            update_info - bool, default True: if "False" doesn't update quantities and unit prices.
-        '''
+            Parameters:
+                section: category name, (default all).
 
+            Returns:
+                dict: {'count': int, 'quantity': float, 'value': float}
+        '''
+        self.flush()  # adds the totals of any buffered items.
         if section == 'all':
-            for section in self.sections:
-                self.data[section].remove_duplicates(update_info)
+            count, quantity, value = self.totals.sum(axis=0)
         else:
-            self.data[section].remove_duplicates(update_info)
+            count, quantity, value = self.totals[self.sections.index(section)]
+        return {'count': int(count), 'quantity': quantity, 'value': value}
 
-    def drop_all_items(self) -> None:
+    def update_bounds(self) -> None:
         '''
-        Function to drop all items from each category in the data dictionary.
+        Function to update where each category starts and stops in the frame.
         '''
+        codes = self._items[category_column].cat.codes.to_numpy()
+        offsets = np.searchsorted(codes, np.arange(len(self.sections) + 1))
+        self.bounds = {
+            section: (offsets[i], offsets[i + 1])
+            for i, section in enumerate(self.sections)
+        }
 
-        for section in self.sections:
-            self.data[section].drop_all_items()
-
-    def check_if_empty(self) -> bool:
+    def new_row_ids(self, count: int) -> range:
         '''
-        Function to check if a dictionary has any items.
+        Function to get the row ids for items being added.
 
-            Returns:
-                True if dictionary has any items.
+            Parameters:
+                count: number of items.
         '''
-        for key in self.sections:
-            if self.data[key].get_items().empty:
-                return True
-        return False
+        row_ids = range(self.next_row_id, self.next_row_id + count)
+        self.next_row_id += count
+        return row_ids
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def new_rows(self, items: pd.DataFrame | list | pd.Series, section=None, row_ids=None) -> pd.DataFrame:
         '''
-        Function to convert the data dictionary into a single dataframe.
+        Function to make the rows for item(s) before adding them to the frame.
+
+            Parameters:
+                items: Dataframe, list of Series, or single Serie of items.
+                section: category of the items or list of categories of each item,
+                         (default uses the 'Category' column).
+                row_ids: ids of the rows, (default uses the index of 'items').
 
             Returns:
-                single dataframe of entire data dictionary.
+                DataFrame with row ids as index.
         '''
+        categories = section
+        if section is None:
+            categories = items[category_column].astype(str).to_numpy()
 
-        items = pd.concat([self.data[cat].get_items()
-                           for cat in self.sections]).reset_index(drop=True)
-        return items
+        rows = to_item_frame(items)
+        if type(section) == str:
+            categories = [section] * rows.shape[0]
+        rows[category_column] = pd.Categorical(
+            categories, dtype=self.category_dtype)
 
-    def get_subtotal(self) -> float:
+        if row_ids is not None:
+            rows.index = pd.Index(row_ids)
+        return rows
+
+    def mark_changed(self, row_ids, sections=[]) -> None:
         '''
-        Function to get the subtotal of the data dictionary.
+        Function to keep track of rows that were added or changed since the last save.
 
-            Returns:
-                float
+            Parameters:
+                row_ids: ids of the rows.
+                sections: categories of the rows.
         '''
-        subtotal = 0
-        for section in self.sections:
-            subtotal += self.data[section].get_subtotal()
-        return subtotal
+        self.changed_rows.update(row_ids)
+        for section in sections:
+            self.data[section].version += 1
 
-    def get_item_category(self, item: pd.DataFrame) -> str:
+    def mark_deleted(self, row_ids, sections=[]) -> None:
         '''
-        Function to get the category an item belongs to.
+        Function to keep track of rows that were deleted since the last save.
 
             Parameters:
-                item: DataFrame of item.
+                row_ids: ids of the rows.
+                sections: categories of the rows.
         '''
-        category = None
-        for i, df in enumerate(sort_order(item)):
-            if not df.empty:
-                category = list(self.sections)[i]
-                break
+        self.deleted_rows.update(row_ids)
+        self.changed_rows.difference_update(row_ids)
+        for section in sections:
+            self.data[section].version += 1
 
-        return category
-
-    def update_item(self, item: pd.DataFrame, delete=False) -> None:
+    def mark_saved(self) -> None:
+        '''
+        Function to clear the tracked changes, called once the data has been saved.
+        '''
+        self.changed_rows.clear()
+        self.deleted_rows.clear()
+        for section in self.sections:
+            self.data[section].saved_version = self.data[section].version
+
+    def get_changed_sections(self) -> list:
+        '''
+        Function to get the categories that changed since the last save.
+        '''
+        return [section for section in self.sections if self.data[section].is_changed()]
+
+    def take_snapshot(self):
+        '''
+        Function to copy the data with its unsaved changes, so it can be saved while the
+        data is still being editted. The data is then marked as saved.
+
+            Returns:
+                Data object.
+        '''
+        snapshot = Data(self.sections, storage=self.storage)
+        snapshot.items = self.items.copy()
+        snapshot.bounds = dict(self.bounds)
+        snapshot.totals = self.totals.copy()
+        snapshot.changed_rows = set(self.changed_rows)
+        snapshot.deleted_rows = set(self.deleted_rows)
+        for section in self.sections:
+            snapshot.data[section].version = self.data[section].version
+            snapshot.data[section].saved_version = self.data[section].saved_version
+
+        self.mark_saved()
+        return snapshot
+
+    def restore_changes(self, snapshot) -> None:
+        '''
+        Function to mark the changes of a snapshot as unsaved again, used when saving it failed.
+
+            Parameters:
+                snapshot: Data object from take_snapshot().
+        '''
+        self.changed_rows.update(snapshot.changed_rows - self.deleted_rows)
+        self.deleted_rows.update(snapshot.deleted_rows)
+        for section in snapshot.get_changed_sections():
+            self.data[section].saved_version = None
+
+    def is_saved(self) -> bool:
+        '''
+        Function to check if there are changes that have not been saved.
+        '''
+        return not self.changed_rows and not self.deleted_rows
+
+    def index_rows(self, rows: pd.DataFrame) -> None:
+        '''
+        Function to add rows to the part number indexes.
+
+            Parameters:
+                rows: DataFrame of items, index are the row ids.
+        '''
+        for index, column in [(self.part_index, labels[0]),
+                              (self.manufacturer_index, labels[1])]:
+            for part_number, row_id in zip(rows[column], rows.index):
+                if pd.notna(part_number) and part_number != '':
+                    index[part_number] = row_id
+
+    def unindex_rows(self, rows: pd.DataFrame) -> None:
+        '''
+        Function to remove rows from the part number indexes.
+
+            Parameters:
+                rows: DataFrame of items, index are the row ids.
+        '''
+        for index, column in [(self.part_index, labels[0]),
+                              (self.manufacturer_index, labels[1])]:
+            for part_number, row_id in zip(rows[column], rows.index):
+                if index.get(part_number) == row_id:
+                    del index[part_number]
+
+    def has_item(self, part_number: str) -> bool:
+        '''
+        Function to check if an item is in the data.
+
+            Parameters:
+                part_number: Digi-Key Part #.
+        '''
+        self.flush()  # indexes any buffered items.
+        return part_number in self.part_index
+
+    def find_item(self, item: pd.DataFrame):
+        '''
+        Function to find the row id of an item.
+
+        Looks up the Digi-Key Part #, then the Manufacturer Part Number,
+        then the description if the item has no known part number.
+
+            Parameters:
+                item: DataFrame of item.
+
+            Returns:
+                row id, None if the item is not found.
+        '''
+        self.flush()  # indexes any buffered items.
+        for index, column in [(self.part_index, labels[0]),
+                              (self.manufacturer_index, labels[1])]:
+            row_id = index.get(item[column].iloc[0])
+            if row_id is not None:
+                return row_id
+
+        matches = self.items.index[
+            self.items['Description'] == item['Description'].iloc[0]]
+        return matches[0] if len(matches) else None
+
+    def get_sections(self) -> list:
+        '''
+        Function to get the avaliable category.
+
+            Returns:
+                list of cateogory names.
+        '''
+        return self.sections
+
+    def get_data(self, section='all') -> pd.DataFrame:
+        '''
+        Function to get the data
+
+            Parameters:
+                section: category name to get items from.
+        '''
+        if section == 'all':
+            return self.items
+        else:
+            return self.data[section].get_items()
+
+    def add_item(self, items: pd.DataFrame | list | pd.Series, section: str) -> None:
+        '''
+        Function to add items to the data dictionary.
+
+            Parameters:
+                key: what category to add items to.
+                items: Dataframe, list of Series, or single Serie of items.
+        '''
+        count = 1 if type(items) == pd.Series else len(items)
+        if not count:
+            return
+
+        # the rows are made and added at the end of their category when flushed.
+        row_ids = self.new_row_ids(count)
+        self.pending_rows.append((items, section, row_ids))
+        self.mark_changed(row_ids, [section])
+
+    def add_sorted_items(self, items: pd.DataFrame, keep_ids=False) -> None:
+        '''
+        Function to add items of any category at once.
+
+            Parameters:
+                items: DataFrame of items with a 'Category' column.
+                keep_ids: use the index of 'items' as the row ids (used when loading).
+        '''
+        if items.empty:
+            return
+
+        if keep_ids:
+            row_ids = items.index
+            self.next_row_id = max(self.next_row_id, row_ids.max() + 1)
+        else:
+            row_ids = self.new_row_ids(items.shape[0])
+
+        # items of a category that is not in the rules (i.e: a renamed sheet) are sorted again.
+        unknown = ~items[category_column].isin(self.sections).to_numpy()
+        if unknown.any():
+            categories = items[category_column].to_numpy(dtype=object)
+            categories[unknown] = np.array(category_rules.categories, dtype=object)[
+                classify_parallel(items[unknown])]
+            items = items.assign(**{category_column: categories})
+        self.pending_rows.append((items, None, row_ids))
+        self.mark_changed(row_ids, items[category_column].astype(str).unique())
+
+    def replace_section(self, section: str, items: pd.DataFrame) -> None:
+        '''
+        Function to replace the items of a category.
+
+            Parameters:
+                section: category name.
+                items: DataFrame of the category's new items (keeping their row ids).
+        '''
+        self.flush()
+        start, stop = self.bounds[section]
+        old_items = self.items.iloc[start:stop]
+        self.unindex_rows(old_items)
+        self.update_totals(old_items, sign=-1)
+        self.mark_deleted(old_items.index.difference(items.index))
+        frames = [self.items.iloc[:start], items, self.items.iloc[stop:]]
+        frames = [df for df in frames if not df.empty]
+        self.items = pd.concat(frames) if frames else self.empty_frame()
+        self.update_bounds()
+        self.index_rows(items)
+        self.update_totals(items)
+        self.mark_changed(items.index, [section])
+
+    def remove_duplicates(self, section='all', update_info=True) -> None:
+        '''
+        Function to remove duplicates (Part Number) and can update the quantities and unit prices of items.
+
+        All the categories are done in a single pass (see combine_duplicates()).
+
+        Parameters:
+            section: what section, or list of sections, to remove duplicates from, (default all).
+            update_info - bool, default True: if "False" doesn't update quantities and unit prices.
+        '''
+        if section == 'all':
+            sections = self.sections
+        elif type(section) == str:
+            sections = [section]
+        else:
+            sections = section
+
+        items = self.items
+        in_sections = items[category_column].isin(sections).to_numpy()
+        kept, combined = combine_duplicates(
+            items[in_sections], [category_column, labels[0]], update_info)
+        if combined.empty:
+            return
+
+        removed = items.index[in_sections].difference(kept.index)
+        self.unindex_rows(items.loc[removed])
+        self.mark_deleted(removed)
+        # only the combined items changed.
+        self.update_totals(items.loc[removed], sign=-1)
+        self.update_totals(items.loc[combined], sign=-1)
+        self.update_totals(kept.loc[combined])
+
+        frames = [df for df in [items[~in_sections], kept] if not df.empty]
+        self.items = pd.concat(frames).sort_values(
+            category_column, kind='stable')
+        self.update_bounds()
+        self.index_rows(kept.loc[combined])
+        self.mark_changed(combined, kept.loc[combined, category_column].unique())
+
+    def reclassify(self, categories=None) -> tuple:
+        '''
+        Function to move items to the category the rules give them, (i.e: after the rules changed).
+        Items that end up with the same part number in a category are combined.
+
+            Parameters:
+                categories: Series of the position of each item's category (see CategoryRules.categories),
+                            index are the row ids, (default sorts all the items now).
+                            Items not in it stay where they are.
+
+            Returns:
+                tuple: dict of the number of items moved {(from category, to category): count},
+                       number of items combined.
+        '''
+        if list(category_rules.categories) != list(self.sections):
+            raise ValueError('The categories of the sorting rules are not the categories of the items.')
+
+        items = self.items
+        if categories is None:
+            categories = pd.Series(classify_parallel(items), index=items.index)
+
+        old_codes = items[category_column].cat.codes.to_numpy()
+        positions = categories.reindex(items.index).to_numpy()
+        known = pd.notna(positions)
+        # checking the categories before anything is changed.
+        if ((positions[known] < 0) | (positions[known] >= len(self.sections))).any():
+            raise ValueError('Items were given a category that does not exist.')
+        names = items[category_column].to_numpy(dtype=object)
+        names[known] = np.array(category_rules.categories, dtype=object)[
+            positions[known].astype(int)]
+        new_column = pd.Categorical(names, dtype=self.category_dtype)
+        moved = new_column.codes != old_codes
+        if not moved.any():
+            return {}, 0
+
+        moves = pd.Series(list(zip(items[category_column].to_numpy()[moved],
+                                   new_column[moved]))).value_counts(sort=False)
+        moved_from = items[moved]
+        self.update_totals(moved_from, sign=-1)
+        items = items.assign(**{category_column: new_column})
+        self.update_totals(items[moved])
+        self.items = items.sort_values(category_column, kind='stable')
+        self.update_bounds()
+
+        to_sections = set(new_column[moved])
+        self.mark_changed(moved_from.index,
+                          to_sections | set(moved_from[category_column]))
+
+        # moved items are combined with the items with the same part number.
+        count = self.items.shape[0]
+        self.remove_duplicates(list(to_sections))
+        moves = {move: int(count) for move, count in moves.items()}
+        return moves, count - self.items.shape[0]
+
+    def drop_all_items(self) -> None:
+        '''
+        Function to drop all items from each category in the data dictionary.
+        '''
+        self.mark_deleted(self.items.index,
+                          self.items[category_column].unique())
+        self.items = self.empty_frame()
+        self.update_bounds()
+        self.totals[:] = 0
+        self.part_index.clear()
+        self.manufacturer_index.clear()
+
+    def check_if_empty(self) -> bool:
+        '''
+        Function to check if a dictionary has any items.
+
+            Returns:
+                True if dictionary has any items.
+        '''
+        for key in self.sections:
+            if self.data[key].get_items().empty:
+                return True
+        return False
+
+    def to_dataframe(self) -> pd.DataFrame:
+        '''
+        Function to convert the data dictionary into a single dataframe.
+
+            Returns:
+                single dataframe of entire data dictionary.
+        '''
+        return self.items[labels].reset_index(drop=True)
+
+    def get_subtotal(self) -> float:
+        '''
+        Function to get the subtotal of the data dictionary.
+
+            Returns:
+                float
+        '''
+        return self.get_totals()['value']
+
+    def get_item_category(self, item: pd.DataFrame) -> str:
+        '''
+        Function to get the category an item belongs to.
+
+            Parameters:
+                item: DataFrame of item.
+        '''
+        if item.empty:
+            return None
+        categories = category_rules.classify(item['Description'])
+        return list(self.sections)[categories.min()]
+
+    def update_item(self, item: pd.DataFrame, delete=False) -> None:
         '''
         Function to update an item.
         Triggered when item is editted (see get_editted() in project_window.py).
@@ -357,186 +1417,575 @@ class Data:
                 delete - bool: drop item (default false).
         '''
 
-        # getting item category
-        category = self.get_item_category(item)
+        row_id = self.find_item(item)
+        if row_id is None:
+            return
+
+        row = self.items.loc[[row_id]]
+        section = row[category_column].iloc[0]
+        self.unindex_rows(row)
+        self.update_totals(row, sign=-1)
+        if delete:
+            self.items = self.items.drop(index=row_id)
+            self.update_bounds()
+            self.mark_deleted([row_id], [section])
+        else:
+            new_item = to_item_frame(item).iloc[0]
+            for column in labels + description_columns:
+                self.items.at[row_id, column] = new_item[column]
+            row = self.items.loc[[row_id]]
+            self.index_rows(row)
+            self.update_totals(row)
+            self.mark_changed([row_id], [section])
 
-        # updating the item in the dictionary
-        category_items = self.data[category].get_items()
-        for i in range(category_items.shape[0]):
-            # checking if item's description matches any in each category.
-            if category_items.iloc[i]['Description'] == item["Description"].iloc[0]:
-                self.editted_save = False
-                if delete:
-                    self.data[category].get_items().drop(
-                        index=i, inplace=True)
-                else:
-                    self.data[category].get_items().iloc[i] = item.iloc[0]
-                break
 
+def get_temp_filepath(filepath: str) -> str:
+    '''
+    Function to get the filepath of the temporary file used when writing a file.
 
-Inventory = Data(dict_keys)
-Items = Data(dict_keys)
+    Files are written to the temporary file then renamed, so a file is never half written.
 
+        Parameters:
+            filepath: filepath of the file.
 
-def sort_order(order: pd.DataFrame) -> list:
+        Returns:
+            str, i.e: 'Saved_Lists/Inventory.tmp.xlsx'
     '''
-    Function to sort an order (or any dataframe) into categories based on the item description.
-    (i.e: Resistors, Capacitors, etc...)
+    base, ext = os.path.splitext(filepath)
+    return f'{base}.tmp{ext}'
 
-        Parameter
-            order - DataFrame: dataframe of items.
 
-        Returns:
-            list of dataframe for each category.
+class ExcelStorage:
     '''
+    Class to load/save a Data object from/to an excel file, with a sheet for each category.
+
+    Reading an excel file is slow, so a binary snapshot of the items can be kept next
+    to the excel file. The snapshot is only used if the excel file has not changed since
+    the snapshot was written (same modified time and size, or same hash).
+
+    Attributes:
+        filepath: filepath to the excel file.
+        snapshot: keep a snapshot of the items (default False).
+    '''
+
+    def __init__(self, filepath: str, snapshot=False) -> None:
+        self.filepath = filepath
+        self.snapshot = snapshot
+        base, _ = os.path.splitext(filepath)
+        self.snapshot_path = f'{base}.snapshot'
+        self.snapshot_key_path = f'{base}.snapshot.json'
+
+    def exists(self) -> bool:
+        '''
+        Function to check if the excel file exists.
+        '''
+        return os.path.exists(self.filepath)
 
-    # list of key description words to sorting items
-    ac_transformer_conds = ['AC/AC', 'AC Transformer', 'AC Trans']
-    pot_conds = ['potentiometer', 'pot']
-    acdc_conds = ['AC/DC', 'AC/DC Converter', 'ACDC']
-    fan_conds = ['fan', 'fans']
-    audio_conds = ['speaker', 'audio', 'mp3']
-    ics_conds = ['ics', 'ic']
-    diodes_conds = ['diode']
-    modules_conds = ['modules', 'module']
-    connectors_conds = ['conn', 'term', 'socket', 'receptacle']
-    capacitors_conds = ['cap', 'capacitor', 'capacitors']
-    resistors_conds = ['res', 'resistor', 'resistors']
-    leds_conds = ['leds', 'led', 'light']
-    transistors_conds = ['transistors', 'transistor', 'NPN', "PNP"]
-    inductors_conds = ['inductors', 'inductor', 'ind']
-    displays_conds = ['display', 'screen']
-    buttons_conds = ['button', 'switch', 'tact']
-    regulator_conds = ['reg', 'regulator']
-    resonator_conds = ['crystal', 'resonator']
-    encoder_conds = ['encoder']
-    relay_conds = ['relay']
-
-    # empty lists for parts to be added.
-    # if adding new sections, dont forget to add
-    ac_transformer, potentiometer = [], []
-    acdc, audio, fans = [], [], []
-    resistors, capacitors, inductors = [], [], []
-    transistors, diodes, ics = [], [], []
-    leds, connectors, buttons = [], [], []
-    displays, modules, other = [], [], []
-    regulator, logic_gates, resonators = [], [], []
-    encoders, relay = [], []
-
-    # THIS NEEDS TO BE IN THE SAME ORDER AS THE INVENTORY DICTIONARY!
-    # Otherwise when showing a category it will display an unintended one.
-    sections = [
-        resistors, capacitors, inductors, transistors,
-        diodes, regulator, ics, logic_gates, connectors, displays, buttons, leds,
-        audio, potentiometer, modules, fans, acdc, ac_transformer, resonators, encoders,
-        relay,
-        other
-    ]
-
-    # sorting the order into categories by checking if any words from
-    # the conditions are in the item description.
-    for i, descrip in enumerate(order['Description']):
-        line = descrip.lower().split()
-
-        if any(word.lower() in line for word in ac_transformer_conds):
-            ac_transformer.append(order.iloc[i])
-
-        elif any(word.lower() in line for word in regulator_conds):
-            regulator.append(order.iloc[i])
-
-        elif any(word.lower() in line for word in pot_conds):
-            potentiometer.append(order.iloc[i])
-
-        elif any(word.lower() in line for word in acdc_conds):
-            acdc.append(order.iloc[i])
-
-        elif any(word.lower() in line for word in fan_conds):
-            fans.append(order.iloc[i])
-
-        elif (
-            any(word.lower() in line for word in audio_conds) or
-            all(word.lower() in line for word in ['board', 'max9744'])
-        ):
-            audio.append(order.iloc[i])
-
-        elif any(word.lower() in line for word in ics_conds):
-            if any(word.lower() in line for word in ['gate']):
-                logic_gates.append(order.iloc[i])
+    def get_file_key(self, with_hash=True) -> dict:
+        '''
+        Function to get the key of the excel file used to check if a snapshot is stale.
+
+            Parameters:
+                with_hash: include the hash of the file (needs to read the file).
+        '''
+        stat = os.stat(self.filepath)
+        key = {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+        if with_hash:
+            file_hash = hashlib.sha256()
+            with open(self.filepath, 'rb') as file:
+                for block in iter(lambda: file.read(1 << 20), b''):
+                    file_hash.update(block)
+            key['hash'] = file_hash.hexdigest()
+        return key
+
+    def load_snapshot(self) -> pd.DataFrame | None:
+        '''
+        Function to read the snapshot of the items.
+
+            Returns:
+                DataFrame, None if there is no snapshot or it is stale.
+        '''
+        if not self.snapshot or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_key_path) as file:
+                saved_key = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        key = self.get_file_key(with_hash=False)
+        if [key['mtime'], key['size']] != [saved_key.get('mtime'), saved_key.get('size')]:
+            # file was touched or copied, checking if the content is the same.
+            key = self.get_file_key()
+            if key['hash'] != saved_key.get('hash'):
+                return None
+            self.write_snapshot_key(dict(saved_key, **key))
+
+        if saved_key.get('format') == 'feather':
+            return pd.read_feather(self.snapshot_path)
+        return pd.read_pickle(self.snapshot_path)
+
+    def write_snapshot_key(self, key: dict) -> None:
+        '''
+        Function to write the key of the snapshot.
+        '''
+        temp_filepath = get_temp_filepath(self.snapshot_key_path)
+        with open(temp_filepath, 'w') as file:
+            json.dump(key, file)
+        os.replace(temp_filepath, self.snapshot_key_path)
+
+    def write_snapshot(self, items: pd.DataFrame) -> None:
+        '''
+        Function to write the snapshot of the items, keyed to the current excel file.
+
+        Uses a feather file if pyarrow is installed, otherwise a pickle file.
+        '''
+        items = items[labels + [category_column]].reset_index(drop=True)
+        temp_filepath = get_temp_filepath(self.snapshot_path)
+        key = self.get_file_key()
+        key['format'] = 'pickle'
+        if pyarrow:
+            try:
+                items.to_feather(temp_filepath)
+                key['format'] = 'feather'
+            except pyarrow.ArrowException:
+                # mixed datatypes in a column, (i.e numbers and text part numbers).
+                pass
+        if key['format'] == 'pickle':
+            items.to_pickle(temp_filepath)
+        os.replace(temp_filepath, self.snapshot_path)
+        self.write_snapshot_key(key)
+
+    def load(self, data: Data) -> None:
+        '''
+        Function to add the items of every sheet to the data, using the sheetnames as the category.
+        '''
+        items = self.load_snapshot()
+        if items is None:
+            sheets = pd.read_excel(self.filepath, sheet_name=None)
+            sheets = [
+                sheets[section].assign(**{category_column: section})
+                for section in sheets.keys() if not sheets[section].empty
+            ]
+            if not sheets:
+                return
+            items = pd.concat(sheets)
+            if self.snapshot:
+                self.write_snapshot(items)
+        data.add_sorted_items(items)
+
+    def get_sheet_paths(self, workbook: zipfile.ZipFile) -> dict:
+        '''
+        Function to get the path of each sheet inside the excel (zip) file.
+
+            Returns:
+                dict of sheetname to path, i.e: {'Resistors': 'xl/worksheets/sheet1.xml'}
+        '''
+        relationships = ElementTree.fromstring(
+            workbook.read('xl/_rels/workbook.xml.rels'))
+        targets = {
+            relationship.get('Id'): relationship.get('Target')
+            for relationship in relationships
+        }
+
+        paths = {}
+        sheets = ElementTree.fromstring(workbook.read('xl/workbook.xml'))
+        for sheet in sheets.iter(f'{{{excel_namespaces["main"]}}}sheet'):
+            target = targets[sheet.get(f'{{{excel_namespaces["relationships"]}}}id')]
+            if target.startswith('/'):
+                paths[sheet.get('name')] = target[1:]
             else:
-                ics.append(order.iloc[i])
+                paths[sheet.get('name')] = f'xl/{target}'
+        return paths
+
+    def get_sheet_xml(self, items: pd.DataFrame, header_style: str) -> str:
+        '''
+        Function to make the xml of a sheet, (text is written as inline strings).
+
+            Parameters:
+                items: DataFrame of the sheet's items.
+                header_style: style attribute for the header cells.
+
+            Returns:
+                str
+        '''
+        def cell(column: str, row: int, value) -> str:
+            if isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+                if pd.isna(value):
+                    return ''
+                number = repr(float(value))
+                number = number[:-2] if number.endswith('.0') else number
+                return f'<c r="{column}{row}"><v>{number}</v></c>'
+            if value is None or value is pd.NA or value != value:  # empty cell
+                return ''
+            text = escape(excel_illegal_chars.sub('', str(value)))
+            return f'<c r="{column}{row}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+        columns = [chr(ord('A') + i) for i in range(len(labels))]
+        header = ''.join(
+            f'<c r="{column}1" t="inlineStr"{header_style}><is><t>{escape(label)}</t></is></c>'
+            for column, label in zip(columns, labels)
+        )
+        rows = [f'<row r="1">{header}</row>']
+        for row, values in enumerate(items[labels].itertuples(index=False), start=2):
+            cells = ''.join(cell(column, row, value)
+                            for column, value in zip(columns, values))
+            rows.append(f'<row r="{row}">{cells}</row>')
+
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<worksheet xmlns="{excel_namespaces["main"]}"><sheetData>'
+            + ''.join(rows) +
+            '</sheetData></worksheet>'
+        )
+
+    def save_sheets(self, data: Data, sections: list) -> bool:
+        '''
+        Function to rewrite only the sheets of some categories, the rest of the
+        excel file is copied as is.
+
+            Parameters:
+                data: Data object to save.
+                sections: list of category names to rewrite.
+
+            Returns:
+                False if a sheet is missing from the file (needs a full save).
+        '''
+        temp_filepath = get_temp_filepath(self.filepath)
+        with zipfile.ZipFile(self.filepath) as workbook:
+            paths = self.get_sheet_paths(workbook)
+            if any(section not in paths for section in sections):
+                return False
+
+            sheets = {}
+            for section in sections:
+                # keeping the header style of the sheet.
+                with workbook.open(paths[section]) as sheet:
+                    style = re.search(r'<c r="A1"[^>]*?( s="\d+")', sheet.read(4096).decode(errors='ignore'))
+                sheets[paths[section]] = self.get_sheet_xml(
+                    data.data[section].get_items(), style.group(1) if style else '')
+
+            with zipfile.ZipFile(temp_filepath, 'w', zipfile.ZIP_DEFLATED) as new_workbook:
+                for info in workbook.infolist():
+                    if info.filename in sheets:
+                        new_workbook.writestr(info, sheets[info.filename])
+                    else:
+                        new_workbook.writestr(info, workbook.read(info))
+        os.replace(temp_filepath, self.filepath)
+        return True
+
+    def save(self, data: Data, full=False) -> int:
+        '''
+        Function to write the data, with each sheetname as the category name.
+
+        Only the sheets of the categories that changed since the last save are rewritten.
+
+            Parameters:
+                data: Data object to save.
+                full: rewrite every sheet.
+
+            Returns:
+                number of rows written.
+        '''
+        sections = data.get_changed_sections()
+        if not full and not sections:
+            return 0
+
+        if full or not self.exists() or not self.save_sheets(data, sections):
+            sections = data.get_sections()
+            temp_filepath = get_temp_filepath(self.filepath)
+            with pd.ExcelWriter(temp_filepath) as writer:
+                for section in sections:
+                    data.data[section].save_toexcel(writer=writer)
+            os.replace(temp_filepath, self.filepath)
+        if self.snapshot:
+            self.write_snapshot(data.items)
+        return sum(data.data[section].get_items().shape[0] for section in sections)
+
+
+class SQLiteStorage:
+    '''
+    Class to load/save a Data object from/to a SQLite database.
+
+    The items are stored in one table with the row ids as primary key, and indexes on
+    the part numbers and the category. Saving only writes the rows that changed since
+    the last save, in a single transaction.
+
+    Attributes:
+        filepath: filepath to the database file.
+    '''
+
+    columns = labels + [category_column]
+
+    def __init__(self, filepath: str) -> None:
+        self.filepath = filepath
+
+    def exists(self) -> bool:
+        '''
+        Function to check if the database file exists.
+        '''
+        return os.path.exists(self.filepath)
 
-        elif any(word.lower() in line for word in diodes_conds):
-            diodes.append(order.iloc[i])
+    def connect(self) -> sqlite3.Connection:
+        '''
+        Function to connect to the database, creates the items table if needed.
+        '''
+        connection = sqlite3.connect(self.filepath)
+        columns = ', '.join(
+            f'"{column}" {"REAL" if column in ["Unit Price", "Quantity"] else "TEXT"}'
+            for column in self.columns
+        )
+        with connection:
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS items (row_id INTEGER PRIMARY KEY, {columns})')
+            for name, column in [('part_number', labels[0]),
+                                 ('manufacturer_part_number', labels[1]),
+                                 ('category', category_column)]:
+                connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS {name} ON items ("{column}")')
+        return connection
+
+    def load(self, data: Data) -> None:
+        '''
+        Function to add the items in the database to the data, keeping their row ids.
+        '''
+        connection = self.connect()
+        try:
+            items = pd.read_sql_query(
+                'SELECT * FROM items ORDER BY row_id', connection, index_col='row_id')
+        finally:
+            connection.close()
+        items.index.name = None
+        data.add_sorted_items(items, keep_ids=True)
+
+    def save(self, data: Data, full=False) -> int:
+        '''
+        Function to write the rows that changed since the last save.
 
-        elif any(word.lower() in line for word in modules_conds):
-            modules.append(order.iloc[i])
+            Parameters:
+                data: Data object to save.
+                full: rewrite every row (used when creating the database).
+
+            Returns:
+                number of rows written (or deleted).
+        '''
+        if full:
+            row_ids = data.items.index
+        else:
+            row_ids = data.items.index.intersection(list(data.changed_rows))
+        rows = data.items.loc[row_ids, self.columns].astype(object)
+        rows = rows.where(rows.notna(), None)
+        records = [(int(row_id), *values)
+                   for row_id, values in zip(rows.index, rows.itertuples(index=False))]
+
+        columns = ', '.join(f'"{column}"' for column in self.columns)
+        marks = ', '.join('?' for _ in range(len(self.columns) + 1))
+        connection = self.connect()
+        try:
+            with connection:  # single transaction
+                if full:
+                    connection.execute('DELETE FROM items')
+                else:
+                    connection.executemany(
+                        'DELETE FROM items WHERE row_id = ?',
+                        [(int(row_id),) for row_id in data.deleted_rows])
+                connection.executemany(
+                    f'INSERT OR REPLACE INTO items (row_id, {columns}) VALUES ({marks})',
+                    records)
+        finally:
+            connection.close()
+        return len(records) + (0 if full else len(data.deleted_rows))
 
-        elif any(word.lower() in line for word in connectors_conds):
-            connectors.append(order.iloc[i])
 
-        elif any(word.lower() in line for word in capacitors_conds):
-            capacitors.append(order.iloc[i])
+'''
+Inventory storage, the inventory can be stored in an excel file ('xlsx') or in
+a SQLite database ('sqlite'), chosen by "inventory_storage" in the settings file.
+Excel files can still be imported/exported when using 'sqlite' (see export_inventory()).
+'''
+settings_file = 'Saved_Lists/Settings.json'
+default_settings = {'inventory_storage': 'xlsx'}
+inventory_files = {
+    'xlsx': 'Saved_Lists/Inventory.xlsx',
+    'sqlite': 'Saved_Lists/Inventory.db'
+}
 
-        elif any(word.lower() in line for word in resistors_conds):
-            resistors.append(order.iloc[i])
 
-        elif any(word.lower() in line for word in leds_conds):
-            leds.append(order.iloc[i])
+def load_settings() -> dict:
+    '''
+    Function to read the settings file, missing settings are the defaults (see default_settings).
+
+        Returns:
+            dict of settings.
+    '''
+    settings = dict(default_settings)
+    try:
+        with open(settings_file) as file:
+            settings.update(json.load(file))
+    except (OSError, ValueError):
+        pass
+
+    if settings['inventory_storage'] not in inventory_files:
+        raise ValueError(f'"inventory_storage" in {settings_file} must be one of '
+                         f'{list(inventory_files)}, not {settings["inventory_storage"]!r}.')
+    return settings
+
+
+def save_settings(settings: dict) -> None:
+    '''
+    Function to write the settings file, (the settings are used the next time the program starts).
+
+        Parameters:
+            settings: dict of settings.
+    '''
+    temp_filepath = get_temp_filepath(settings_file)
+    with open(temp_filepath, 'w') as file:
+        json.dump(settings, file, indent=4)
+    os.replace(temp_filepath, settings_file)
+
+
+inventory_storage = load_settings()['inventory_storage']
+
+
+def get_inventory_storage() -> ExcelStorage | SQLiteStorage:
+    '''
+    Function to get the storage for the inventory, see 'inventory_storage'.
+    '''
+    if inventory_storage == 'sqlite':
+        return SQLiteStorage(inventory_files['sqlite'])
+    return ExcelStorage(inventory_files['xlsx'], snapshot=True)
+
+
+Inventory = Data(dict_keys, storage=get_inventory_storage())
+Items = Data(dict_keys)
+
+
+# orders with at least this many items are sorted on multiple processes (see classify_parallel()).
+parallel_classify_rows = 200000
+
+
+def classify_words(words: list) -> np.ndarray:
+    '''
+    Function to get the category of description words, run on the worker processes of classify_parallel().
+    '''
+    return category_rules.classify_words(pd.Series(words, dtype=object))
+
+
+def classify_parallel(frame: pd.DataFrame, workers=None) -> np.ndarray:
+    '''
+    Function to get the category of items, using multiple processes for very large frames
+    (i.e: years of orders or a catalog). Smaller frames are done in this process, since
+    starting the processes takes longer than sorting them.
+
+        Parameters:
+            frame: DataFrame of items.
+            workers: number of processes, (default number of CPUs).
+
+        Returns:
+            array of the position of each item's category (see CategoryRules.categories).
+    '''
+    workers = workers or os.cpu_count() or 1
+    # the rules are only profiled in this process (see CategoryRules.start_profiling()).
+    serial = (workers < 2 or frame.shape[0] < parallel_classify_rows
+              or category_rules.profile is not None)
+    if serial and words_column not in frame:
+        return category_rules.classify(frame['Description'])
+
+    # items added to a Data object or read by get_ordersheet() are already split.
+    words = get_item_words(frame)
+    if serial:
+        return category_rules.classify_words(words)
+
+    # each different description is only sent once.
+    rows, unique = pd.factorize(words)
+    if len(unique) < parallel_classify_rows:
+        return category_rules.classify_words(words)
+
+    # chunks are returned in order, so the results line up with the descriptions.
+    chunks = np.array_split(np.asarray(unique, dtype=object), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        categories = np.concatenate(list(executor.map(
+            classify_words, [chunk.tolist() for chunk in chunks])))
+    return categories[rows]
+
 
-        elif any(word.lower() in line for word in transistors_conds) and any('trans' in word for word in line):
-            transistors.append(order.iloc[i])
+def sort_order(order: pd.DataFrame) -> list:
+    '''
+    Function to sort an order (or any dataframe) into categories based on the item description.
+    (i.e: Resistors, Capacitors, etc...)
 
-        elif any(word.lower() in line for word in inductors_conds):
-            inductors.append(order.iloc[i])
+    The rules used to sort the items are in category_rules.json (see CategoryRules).
+    If the items have a 'Category' column (i.e: saved projects) it is used, only items
+    without a category are sorted using the rules.
 
-        elif any(word.lower() in line for word in displays_conds):
-            displays.append(order.iloc[i])
+        Parameter
+            order - DataFrame: dataframe of items.
 
-        elif any(word.lower() in line for word in buttons_conds):
-            buttons.append(order.iloc[i])
+        Returns:
+            list of dataframe for each category.
+    '''
+    if category_column in order:
+        categories = pd.Categorical(
+            order[category_column], categories=dict_keys).codes.astype(int)
+        missing = categories == -1
+        if missing.any():
+            categories[missing] = classify_parallel(order[missing])
+            order = order.assign(**{category_column: np.array(dict_keys)[categories]})
+    else:
+        categories = classify_parallel(order)
 
-        elif any(word.lower() in line for word in resonator_conds):
-            resonators.append(order.iloc[i])
+    # splitting the order, items keep their order within each category.
+    rows = np.argsort(categories, kind='stable')
+    bounds = np.searchsorted(categories[rows], np.arange(len(dict_keys) + 1))
 
-        elif any(word.lower() in line for word in encoder_conds):
-            encoders.append(order.iloc[i])
-            
-        elif any(word.lower() in line for word in relay_conds):
-            relay.append(order.iloc[i])
+    # returning list of dataframe for each category.
+    sections = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        if start == stop:
+            sections.append(pd.DataFrame())
+        else:
+            sections.append(order.iloc[rows[start:stop]].infer_objects())
+    return sections
 
-        else:  # left over
-            other.append(order.iloc[i])
 
-    # returning list of dataframe for each category.
-    return [pd.DataFrame(section) for section in sections]
+# tooltip of the Description header, since it sorts differently in a single category.
+description_sort_tip = ('Click to sort by description.\n'
+                        'When one category is shown, items are sorted by value '
+                        '(i.e: 470 OHM before 1K OHM).')
 
 
-def sort_by(self, index: int, data: pd.DataFrame) -> pd.DataFrame:
+def sort_by(self, index: int, data: pd.DataFrame, by_value=False) -> pd.DataFrame:
     '''
     Function to sort a dataframe by a column header.
 
         Parameters:
             index: index of column.
             data: Dataframe to sort.
+            by_value: sort descriptions by value, only for items of a single category, (default False).
 
         Returns:
             sorted DataFrame.
     '''
     header = labels[index]  # column header name
+    by = header
 
     # condition to fix datatype sorting issues with strings.
     if header == 'Quantity':
         data['Quantity'] = data['Quantity'].astype(int)
     elif header == 'Unit Price':
         data['Unit Price'] = data['Unit Price'].astype(float)
+    elif header == 'Description' and by_value:
+        # sorting by value, i.e: RES 470 OHM before RES 1K OHM (see get_parameters()).
+        if not set(parameter_columns).issubset(data.columns):
+            data = pd.concat([data, get_parameters(data[header])], axis=1)
+        by = ['Ohms', 'Farads', 'Henries', 'Volts', header]
 
     if self.sort_by[header]:
         self.sort_by[header] = False
-        data = data.sort_values(by=header).reset_index(drop=True)
+        data = data.sort_values(by=by).reset_index(drop=True)
     else:
         self.sort_by[header] = True
         data = data.sort_values(
-            by=header, ascending=False).reset_index(drop=True)
+            by=by, ascending=False).reset_index(drop=True)
 
     return data
 
@@ -578,40 +2027,419 @@ def dataframe_to_dict(dataframes=[]) -> dict:
 def load_Inventory() -> None:
     '''
     Function to check if inventory exists, if it does then load the Inventory dictionary data.
+
+    When using a SQLite inventory for the first time, the excel inventory is imported into it.
+    The orders already added to the inventory are loaded too (see OrderManifest).
     '''
-    if not os.path.exists("Saved_Lists/Inventory.xlsx"):
+    order_manifest.load()
+    storage = Inventory.storage
+    if isinstance(storage, SQLiteStorage) and not storage.exists() and \
+            os.path.exists(inventory_files['xlsx']):
+        import_inventory(inventory_files['xlsx'])
+        storage.save(Inventory, full=True)
+        Inventory.mark_saved()
+    elif not inventory_exists():
         return 'Inventory missing...'
     else:
         # loading the Inventory dictionary data
         _ = get_inventory(check_load=False)
 
 
+def inventory_exists() -> bool:
+    '''
+    Function to check if the inventory file exists.
+    '''
+    return Inventory.storage.exists()
+
+
 def get_inventory(check_load=True) -> dict:
     '''
-    Function to get current inventory from the inventory.xlsx (excel) file.
+    Function to get current inventory from the inventory file (see 'inventory_storage').
 
         Parameters:
             check_load: DO NOT CHANGE, NEEDS FOR SET UP.
 
         Returns:
-            Dictionary of class for each sheet in the excel file.
+            Dictionary of class for each category.
     '''
     if check_load == False:  # only runs one for set up
-        inventory = pd.read_excel(
-            'Saved_Lists/Inventory.xlsx', sheet_name=None)
-        for section in inventory.keys():
-            Inventory.data[section].add_item(inventory[section])
+        Inventory.storage.load(Inventory)
+        # building the rows now, so it's done while loading (i.e: on the loader thread).
+        Inventory.flush()
+        Inventory.mark_saved()
         check_load = True
 
     return Inventory.data
 
 
+def save_Inventory(data=None) -> tuple:
+    '''
+    Function to save the inventory to the inventory file (see 'inventory_storage').
+    Only what changed since the last save is written.
+
+        Parameters:
+            data: snapshot of the inventory to save (see Data.take_snapshot()), default Inventory.
+
+        Returns:
+            tuple: number of rows written, number of categories changed.
+    '''
+    if data is None:
+        data = Inventory
+    sections = data.get_changed_sections()
+    rows = data.storage.save(data)
+    data.mark_saved()
+    return rows, len(sections)
+
+
+def save_list_file(filepath: str, data: Data) -> None:
+    '''
+    Function to save the items of a Data object (i.e: a project) as a single sheet,
+    to a '.csv' or '.xlsx' file.
+
+    Written to a temporary file first then renamed, so the file is never half written.
+
+        Parameters:
+            filepath: filepath to save to.
+            data: Data object to save.
+    '''
+    temp_filepath = get_temp_filepath(filepath)
+    # the category is saved so the items don't need to be sorted when opened.
+    items = data.items[labels + [category_column]].reset_index(drop=True)
+    if filepath.split('.')[-1] == 'xlsx':
+        items.to_excel(temp_filepath, index=False)
+    else:
+        items.to_csv(temp_filepath, index=False)
+    os.replace(temp_filepath, filepath)
+
+
+def import_inventory(filepath: str) -> None:
+    '''
+    Function to add the items of an excel inventory file to the inventory.
+
+        Parameters:
+            filepath: filepath to the excel file, (one sheet per category).
+    '''
+    ExcelStorage(filepath).load(Inventory)
+    Inventory.remove_duplicates()
+
+
+def exports_stale_inventory(filepath: str) -> bool:
+    '''
+    Function to check if exporting a file or folder would copy the excel inventory, when
+    the inventory is stored in SQLite (i.e: the excel file is older than the inventory).
+
+        Parameters:
+            filepath: filepath of the file or folder to export.
+
+        Returns:
+            bool: True if the inventory should be exported with export_inventory() instead.
+    '''
+    if not isinstance(Inventory.storage, SQLiteStorage):
+        return False
+    inventory = os.path.abspath(inventory_files['xlsx'])
+    filepath = os.path.abspath(filepath)
+    return inventory == filepath or inventory.startswith(filepath + os.sep)
+
+
+def export_inventory(filepath: str) -> None:
+    '''
+    Function to export the inventory to an excel file, (one sheet per category).
+
+        Parameters:
+            filepath: filepath to the excel file.
+    '''
+    ExcelStorage(filepath).save(Inventory, full=True)
+
+
+def set_inventory_storage(storage: str) -> None:
+    '''
+    Function to choose where the inventory is stored the next time the program starts.
+    The inventory is written there now, so it isn't loaded from an older file.
+
+        Parameters:
+            storage: 'xlsx' or 'sqlite', (see inventory_files).
+    '''
+    if storage == 'sqlite':
+        SQLiteStorage(inventory_files['sqlite']).save(Inventory, full=True)
+    else:
+        export_inventory(inventory_files['xlsx'])
+
+    settings = load_settings()
+    settings['inventory_storage'] = storage
+    save_settings(settings)
+
+
+class OrderCache:
+    '''
+    Class to keep the orders read by get_ordersheet(), so files that have not changed are
+    not read and sorted again (i.e: searching every past order, flipping between orders).
+
+    An order is reused if its file has the same modified time and size, and the sorting
+    rules are the same. The least recently used orders are dropped past 'max_orders'.
+    Orders can also be kept on disk, so they are reused after restarting the program.
+
+    Attributes:
+        max_orders: number of orders kept in memory.
+        folder: folder to keep the orders on disk, (default None, only kept in memory).
+    '''
+
+    def __init__(self, max_orders=64, folder=None) -> None:
+        self.max_orders = max_orders
+        self.folder = folder
+        self.orders = OrderedDict()  # filepath: (key, list of dataframes).
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, filepath: str) -> tuple:
+        '''
+        Function to get the key of an order file, (modified time, size, sorting rules).
+        '''
+        stat = os.stat(filepath)
+        return (stat.st_mtime_ns, stat.st_size, category_rules.rules_hash)
+
+    def get_disk_path(self, filepath: str) -> str:
+        '''
+        Function to get the filepath an order is kept at on disk.
+        '''
+        name = hashlib.sha256(filepath.encode()).hexdigest()[:32]
+        return os.path.join(self.folder, f'{name}.pkl')
+
+    def get(self, filepath: str) -> list | None:
+        '''
+        Function to get a copy of an order, if its file has not changed.
+
+            Parameters:
+                filepath: filepath to the order sheet.
+
+            Returns:
+                list of dataframes for each category, None if the order is not cached.
+        '''
+        filepath = os.path.abspath(filepath)
+        key = self.get_key(filepath)
+        with self.lock:
+            cached = self.orders.get(filepath)
+            if cached is not None and cached[0] == key:
+                self.orders.move_to_end(filepath)
+                self.hits += 1
+                return [items.copy() for items in cached[1]]
+
+        order = self.read_disk(filepath, key)
+        with self.lock:
+            if order is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self.put(filepath, order, key, to_disk=False)
+        return [items.copy() for items in order]
+
+    def put(self, filepath: str, order: list, key=None, to_disk=True) -> None:
+        '''
+        Function to keep a copy of an order.
+
+            Parameters:
+                filepath: filepath to the order sheet.
+                order: list of dataframes for each category.
+                key: key of the file when it was read, (default the current key).
+                to_disk: also keep it on disk, if there is a folder.
+        '''
+        filepath = os.path.abspath(filepath)
+        if key is None:
+            key = self.get_key(filepath)
+        order = [items.copy() for items in order]
+        with self.lock:
+            self.orders[filepath] = (key, order)
+            self.orders.move_to_end(filepath)
+            while len(self.orders) > self.max_orders:
+                self.orders.popitem(last=False)
+        if to_disk and self.folder:
+            self.write_disk(filepath, key, order)
+
+    def read_disk(self, filepath: str, key: tuple) -> list | None:
+        '''
+        Function to read an order kept on disk, None if there is none or the file changed.
+        '''
+        if not self.folder:
+            return None
+        try:
+            with open(self.get_disk_path(filepath), 'rb') as file:
+                saved = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        if saved.get('filepath') != filepath or saved.get('key') != key:
+            return None
+        return saved['order']
+
+    def write_disk(self, filepath: str, key: tuple, order: list) -> None:
+        '''
+        Function to keep an order on disk, (the order is still cached in memory if it fails).
+        '''
+        disk_path = self.get_disk_path(filepath)
+        temp_filepath = get_temp_filepath(disk_path)
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with open(temp_filepath, 'wb') as file:
+                pickle.dump({'filepath': filepath, 'key': key, 'order': order}, file)
+            os.replace(temp_filepath, disk_path)
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        '''
+        Function to drop every order kept in memory.
+        '''
+        with self.lock:
+            self.orders.clear()
+
+    def get_cache_info(self) -> dict:
+        '''
+        Function to get how well the cache is working.
+
+            Returns:
+                dict: {'hits': int, 'misses': int, 'hit_rate': float, 'size': int, 'max_size': int}
+        '''
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self.orders), 'max_size': self.max_orders}
+
+
+# orders read by get_ordersheet(), set a folder (i.e: 'Saved_Lists/Order_Cache') to also keep them on disk.
+order_cache = OrderCache(folder=None)
+
+
 def get_ordersheet(filepath: str) -> list:
+    '''
+    Function to get an ordersheet, sorted into categories.
+
+    Orders are cached (see 'order_cache'), files that have not changed are only read once.
+
+        Parameters:
+            filepath - str: filepath to the othersheet.
+
+        Returns:
+            a list of dataframes for each category, (see sort_order()).
+    '''
+    if os.path.isfile(filepath):
+        order = order_cache.get(filepath)
+        if order is None:
+            key = order_cache.get_key(filepath)
+            order = read_ordersheet(filepath)
+            # the key from before reading, so a file changed while reading is read again.
+            order_cache.put(filepath, order, key)
+        return order
+
+
+# at least this many orders are read on multiple processes (see get_ordersheets()).
+parallel_order_files = 8
+
+
+def get_ordersheets(filepaths: list, workers=None) -> list:
+    '''
+    Function to get many ordersheets at once (i.e: a folder of orders), reading the orders
+    on multiple processes. Orders that are cached are not read again (see get_ordersheet()).
+
+        Parameters:
+            filepaths - list: filepaths to the ordersheets.
+            workers: number of processes, (default number of CPUs).
+
+        Returns:
+            list of orders in the same order as 'filepaths', (see sort_order()).
+    '''
+    filepaths = [filepath for filepath in filepaths if os.path.isfile(filepath)]
+    orders = [order_cache.get(filepath) for filepath in filepaths]
+    positions = [position for position, order in enumerate(orders) if order is None]
+    missing = [filepaths[position] for position in positions]
+    # the keys from before reading, so a file changed while reading is read again.
+    keys = [order_cache.get_key(filepath) for filepath in missing]
+
+    workers = min(workers or os.cpu_count() or 1, len(missing))
+    if workers < 2 or len(missing) < parallel_order_files:
+        read_orders = [read_ordersheet(filepath) for filepath in missing]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            read_orders = list(executor.map(read_ordersheet, missing))
+
+    for position, order, key in zip(positions, read_orders, keys):
+        order_cache.put(filepaths[position], order, key)
+        orders[position] = order
+    return orders
+
+
+# columns read from order sheets, other columns (i.e: 'Index', 'Backorder', 'Extended Price') are skipped.
+order_columns = set(labels + [category_column])
+# text columns are read as text, so part numbers stay as they are and prices keep their '$'.
+order_dtypes = {column: str for column in order_columns if column != 'Quantity'}
+
+
+def to_number(values: pd.Series) -> pd.Series:
+    '''
+    Function to convert a column of numbers or prices to floats, i.e: '$1,234.50' -> 1234.5.
+    Text that is not a number is NaN.
+
+        Parameters:
+            values: Serie of text.
+    '''
+    if values.dtype != object:
+        return values.astype(float)
+    values = values.str.replace('$', '', regex=False).str.replace(',', '', regex=False)
+    return pd.to_numeric(values, errors='coerce').astype(float)
+
+
+def prepare_order(order: pd.DataFrame, description_columns=True) -> pd.DataFrame:
+    '''
+    Function to get the items of an order as read from its file (or a part of it, see read_order_chunks()).
+
+    Keeps the 'labels' (and 'Category') columns, drops the subtotal line, converts the prices
+    and quantities to numbers and adds the description columns (see get_description_columns()).
+
+        Parameters:
+            order - DataFrame: the rows read from an order sheet.
+            description_columns - bool, default True: if "False" doesn't add the description columns.
+
+        Returns:
+            DataFrame of the items.
+    '''
+    # condition for when getting a order that has this labels dropped already.
+    # the category is kept if the file has it (see save_list_file()).
+    if category_column in order:
+        order = order[labels + [category_column]]
+    else:
+        order = order[labels]
+
+    # dropping the subtotal line, (the index still matches the rows of the file).
+    subtotal = order['Unit Price'].str.strip().str.lower() == 'subtotal'
+    if subtotal.any():
+        order = order[~subtotal]
+    order = order.assign(**{
+        'Unit Price': to_number(order['Unit Price']),
+        'Quantity': to_number(order['Quantity'])
+    })
+
+    # retyping some item descriptions, i.e RES -> Resistor
+    update_dict = {
+        'RES': 'Resistor',
+        'CAP': 'Capacitor',
+        'IND': 'Inductor',
+    }
+    for key, value in update_dict.items():
+        if key in order['Description']:
+            order['Description'] = order['Description'].str.replace(
+                key, value.upper(), case=False, n=1)
+
+    # words and values of the descriptions, (see get_description_columns()).
+    if description_columns:
+        order = pd.concat(
+            [order, get_description_columns(order['Description'])], axis=1)
+    return order
+
+
+def read_ordersheet(filepath: str) -> list:
     '''
     Function to read in an ordersheet using pandas.
 
-    Drops columns: 'Index', 'Backorder', 'Extended Price' from the dataframes
-    and the subtotal line ONLY from the csv file.
+    Only reads the 'labels' (and 'Category') columns, skipping: 'Index', 'Backorder',
+    'Extended Price', and drops the subtotal line (csv or xlsx file).
 
         Parameters:
             filepath - str: filepath to the othersheet.
@@ -622,58 +2450,398 @@ def get_ordersheet(filepath: str) -> list:
     if os.path.isfile(filepath):
         filetype = filepath.split(".")[-1]
 
+        # only the needed columns are read, (see 'order_dtypes').
         order = None
         if filetype == 'csv':
-            order = pd.read_csv(filepath)
-            if str(order.iloc[-1]["Unit Price"]).lower() == 'subtotal':
-                # if subtotal line exists drop it.
-                order = order.drop(order.index[-1], axis=0)
-
+            order = pd.read_csv(filepath, usecols=lambda column: column in order_columns,
+                                dtype=order_dtypes, encoding='utf-8-sig')
         elif filetype == 'xlsx':
-            # subtotal line needs to be removed from the xlsx manual.
-            # Need to fix this...
-            order = pd.read_excel(filepath)
-
-        # condition for when getting a order that has this labels dropped already.
-        order = order[labels]
-        order[labels].reset_index(drop=True, inplace=True)  # reindexing
-        if order['Unit Price'].dtype != float:
-            order['Unit Price'] = order['Unit Price'].str.strip(to_strip='$')
-
-        # retyping some item descriptions, i.e RES -> Resistor
-        update_dict = {
-            'RES': 'Resistor',
-            'CAP': 'Capacitor',
-            'IND': 'Inductor',
-        }
-        for key, value in update_dict.items():
-            if key in order['Description']:
-                order['Description'] = order['Description'].str.replace(
-                    key, value.upper(), case=False, n=1)
+            order = pd.read_excel(filepath, usecols=lambda column: column in order_columns,
+                                  dtype=order_dtypes)
 
+        order = prepare_order(order)
         order = sort_order(order)  # sorting the order
         return order
 
 
-def add_order_to_Inventory(order) -> None:
+# rows of an order read at a time when streaming it (see stream_ordersheet()).
+order_chunk_rows = 100000
+# order files larger than this (in bytes) are streamed into the inventory.
+stream_order_bytes = 50 * 1024 * 1024
+
+
+def read_order_chunks(filepath: str, chunksize=order_chunk_rows, description_columns=True):
+    '''
+    Function to read an ordersheet a few rows at a time, so a large file doesn't need to fit in memory.
+
+    Csv files are read in chunks of 'chunksize' rows, xlsx files can't be read in parts
+    so they are read whole and split into chunks.
+
+        Parameters:
+            filepath - str: filepath to the ordersheet.
+            chunksize - int: number of rows in each chunk.
+            description_columns - bool: add the description columns, (see prepare_order()).
+
+        Yields:
+            tuple: DataFrame of the items (see prepare_order()), fraction of the file read.
+    '''
+    filetype = filepath.split(".")[-1]
+    if filetype == 'csv':
+        size = max(os.path.getsize(filepath), 1)
+        with open(filepath, 'rb') as file:
+            reader = pd.read_csv(file, usecols=lambda column: column in order_columns,
+                                 dtype=order_dtypes, encoding='utf-8-sig', chunksize=chunksize)
+            with reader:
+                for chunk in reader:
+                    yield prepare_order(chunk, description_columns), min(file.tell() / size, 1.0)
+    elif filetype == 'xlsx':
+        order = pd.read_excel(filepath, usecols=lambda column: column in order_columns,
+                              dtype=order_dtypes)
+        rows = max(order.shape[0], 1)
+        for start in range(0, order.shape[0], chunksize):
+            stop = min(start + chunksize, order.shape[0])
+            yield prepare_order(order.iloc[start:stop], description_columns), stop / rows
+
+
+def preview_ordersheet(filepath: str, rows=order_chunk_rows) -> list:
+    '''
+    Function to get the first items of an ordersheet sorted into categories, so a large order
+    can be shown without reading all of it. The order is not cached (see get_ordersheet()).
+
+        Parameters:
+            filepath - str: filepath to the ordersheet.
+            rows - int: number of items to read.
+
+        Returns:
+            a list of dataframes for each category, (see sort_order()).
+    '''
+    chunks = read_order_chunks(filepath, rows)
+    try:
+        chunk, _ = next(chunks, (None, None))
+    finally:
+        chunks.close()
+    if chunk is None:
+        return [pd.DataFrame() for _ in dict_keys]
+    return sort_order(chunk)
+
+
+def save_order_categories(filepath: str, order: list) -> None:
+    '''
+    Function to add the category of each item to an order file (i.e: a past order),
+    so its items don't need to be sorted again when it is read.
+
+        Parameters:
+            filepath: filepath to the order sheet.
+            order: list of dataframes for each category, from get_ordersheet(filepath).
+    '''
+    filetype = filepath.split(".")[-1]
+    if filetype == 'xlsx':
+        save_excel_order_categories(filepath, order)
+        return
+
+    # read as text, so the cells are written back as they were (i.e: part numbers '0022232041').
+    sheet = pd.read_csv(filepath, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+
+    # rows not in the order (i.e: subtotal line) have no category.
+    categories = pd.Series(None, index=sheet.index, dtype=object)
+    for items, section in zip(order, dict_keys):
+        if not items.empty:
+            categories[items.index] = section
+    sheet[category_column] = categories
+
+    temp_filepath = get_temp_filepath(filepath)
+    sheet.to_csv(temp_filepath, index=False, encoding='utf-8-sig')
+    os.replace(temp_filepath, filepath)
+
+
+def save_excel_order_categories(filepath: str, order: list) -> None:
+    '''
+    Function to add the category of each item to an excel order file, (see save_order_categories()).
+
+    Only the cells of the 'Category' column are written, the other cells keep their values and types.
+
+        Parameters:
+            filepath: filepath to the order sheet.
+            order: list of dataframes for each category, from get_ordersheet(filepath).
+    '''
+    from openpyxl import load_workbook  # used by pandas to read excel files.
+
+    workbook = load_workbook(filepath)
+    sheet = workbook.worksheets[0]  # the sheet read by read_ordersheet().
+
+    # the column is reused if the order already has categories.
+    headers = [cell.value for cell in sheet[1]]
+    if category_column in headers:
+        column = headers.index(category_column) + 1
+    else:
+        column = sheet.max_column + 1
+        sheet.cell(row=1, column=column, value=category_column)
+
+    # the index of the items is their row in the sheet after the header row.
+    for row in range(2, sheet.max_row + 1):
+        sheet.cell(row=row, column=column).value = None
+    for items, section in zip(order, dict_keys):
+        for index in items.index:
+            sheet.cell(row=index + 2, column=column, value=section)
+
+    temp_filepath = get_temp_filepath(filepath)
+    workbook.save(temp_filepath)
+    os.replace(temp_filepath, filepath)
+
+
+def add_order_to_Inventory(order, data=None) -> None:
     '''
     Function to add a new order to the inventory
 
         Parameter:
             order: dict of categories or single dataframe.
+            data: where to add the order, (default Inventory).
     '''
+    if data is None:
+        data = Inventory
 
     if type(order) == dict:
-        for section in Inventory.get_sections():
-            # checking if pass 'order' is empty
-            if not order[section].get_items().empty:
-                Inventory.data[section].add_item(order[section].get_items())
-                Inventory.data[section].remove_duplicates()
-    else:
-        for items, section in zip(order, Inventory.get_sections()):
-            if not items.empty:
-                Inventory.data[section].add_item(items)
-                Inventory.data[section].remove_duplicates()
+        order = [order[section].get_items()
+                 for section in data.get_sections()]
+
+    # adding every category first, so the inventory is only concatenated once.
+    sections = []
+    for items, section in zip(order, data.get_sections()):
+        # checking if pass 'order' is empty
+        if not items.empty:
+            data.data[section].add_item(items)
+            sections.append(section)
+    data.flush()
+    data.remove_duplicates(sections)
+
+
+def add_orders_to_Inventory(orders: list, data=None) -> None:
+    '''
+    Function to add many orders to the inventory at once, (i.e: from get_ordersheets()).
+
+    The items of every order are put together first so each category only has its duplicates
+    removed once, giving the same items as adding the orders one after another.
+
+        Parameters:
+            orders: list of orders, each a list of dataframes for each category (see sort_order()).
+            data: where to add the orders, (default Inventory).
+    '''
+    if data is None:
+        data = Inventory
+
+    sections = []
+    for position in range(len(data.get_sections())):
+        items = [order[position] for order in orders if not order[position].empty]
+        sections.append(pd.concat(items) if items else pd.DataFrame())
+    add_order_to_Inventory(sections, data)
+
+
+def stream_ordersheet(filepath: str, data=None, chunksize=order_chunk_rows, progress=None) -> int:
+    '''
+    Function to add a large ordersheet to the inventory a chunk at a time (see read_order_chunks()).
+
+    Each chunk is sorted into categories and merged into a separate Data object, removing duplicates
+    as it goes, so only the combined items are kept in memory. Those are added to the data once the
+    whole file is read, so nothing is added if reading fails part way. The items are the same as adding
+    the whole file at once (see add_order_to_Inventory()), duplicates keep the first item with the highest price.
+
+        Parameters:
+            filepath - str: filepath to the ordersheet.
+            data - Data: where to add the items, (default Inventory).
+            chunksize - int: number of rows read at a time.
+            progress - function: called after each chunk with the number of rows read and
+                       the fraction of the file read, (i.e: to update a progress bar).
+
+        Returns:
+            int: number of rows read.
+    '''
+    if data is None:
+        data = Inventory
+
+    order = Data(data.sections)
+    rows = 0
+    for chunk, fraction in read_order_chunks(filepath, chunksize):
+        add_order_to_Inventory(sort_order(chunk), order)
+        rows += chunk.shape[0]
+        if progress is not None:
+            progress(rows, fraction)
+    add_order_to_Inventory(order.data, data)
+    return rows
+
+
+# columns of the items used to tell orders apart, (see get_order_hash()).
+order_hash_columns = [labels[0], labels[1], 'Quantity', 'Unit Price']
+
+
+def hash_items(items: pd.DataFrame) -> int:
+    '''
+    Function to get the hash of the items of an order, it doesn't depend on the order of
+    the rows so the hashes of parts of an order can be added together (see get_file_hash()).
+
+        Parameters:
+            items: DataFrame of items, (i.e: from prepare_order()).
+
+        Returns:
+            int: sum of the hash of each item, (64 bits).
+    '''
+    if items.empty:
+        return 0
+    # part numbers are compared without case or spaces, prices to the cent fraction in the order sheet.
+    items = pd.DataFrame({
+        labels[0]: items[labels[0]].fillna('').astype(str).str.strip().str.upper(),
+        labels[1]: items[labels[1]].fillna('').astype(str).str.strip().str.upper(),
+        'Quantity': items['Quantity'].astype(float),
+        'Unit Price': items['Unit Price'].astype(float).round(5),
+    })
+    rows = pd.util.hash_pandas_object(items, index=False).to_numpy()
+    return int(rows.sum(dtype=np.uint64))
+
+
+def get_order_hash(order: list) -> str:
+    '''
+    Function to get the hash of an order, orders with the same items have the same hash
+    even if their files have different names (i.e: an order downloaded again).
+
+        Parameters:
+            order: list of dataframes for each category, (see get_ordersheet()).
+
+        Returns:
+            str: hash of the items and the number of items.
+    '''
+    total, rows = 0, 0
+    for items in order:
+        total += hash_items(items)
+        rows += items.shape[0]
+    return f'{total % 2 ** 64:016x}-{rows}'
+
+
+def get_file_hash(filepath: str, chunksize=order_chunk_rows) -> str:
+    '''
+    Function to get the hash of an order file (see get_order_hash()) without sorting it,
+    reading it a few rows at a time (see read_order_chunks()).
+
+        Parameters:
+            filepath - str: filepath to the ordersheet.
+            chunksize - int: number of rows read at a time.
+    '''
+    total, rows = 0, 0
+    for items, _ in read_order_chunks(filepath, chunksize, description_columns=False):
+        total += hash_items(items)
+        rows += items.shape[0]
+    return f'{total % 2 ** 64:016x}-{rows}'
+
+
+class OrderManifest:
+    '''
+    Class to keep track of the orders added to the inventory by the hash of their items
+    (see get_order_hash()), so an order is only added once, even when it is renamed.
+
+    The manifest is a json file of {hash: filename of the order in 'folder'}, it is loaded
+    once (see load_Inventory()). Orders put in the folder by hand are added when it's loaded,
+    and orders deleted from the folder are dropped so they can be added again.
+
+    Attributes:
+        filepath: filepath to the json file.
+        folder: folder of the past orders.
+    '''
+
+    def __init__(self, filepath: str, folder: str) -> None:
+        self.filepath = filepath
+        self.folder = folder
+        self.orders = {}  # hash: filename.
+        self.loaded = False
+        self.lock = threading.Lock()
+
+    def load(self) -> None:
+        '''
+        Function to read the manifest, and update it with the orders in the folder.
+        '''
+        try:
+            with open(self.filepath) as file:
+                orders = json.load(file)
+        except (OSError, ValueError):
+            orders = {}
+
+        filenames = set()
+        if os.path.isdir(self.folder):
+            filenames = {filename for filename in os.listdir(self.folder)
+                         if filename.split('.')[-1] in ['csv', 'xlsx']}
+        changed = len(orders)
+        orders = {order_hash: filename for order_hash, filename in orders.items()
+                  if filename in filenames}
+        changed = changed != len(orders)
+
+        for filename in sorted(filenames - set(orders.values())):
+            try:
+                orders[get_file_hash(os.path.join(self.folder, filename))] = filename
+                changed = True
+            except (OSError, ValueError, KeyError):
+                # not an order sheet.
+                pass
+
+        with self.lock:
+            self.orders = orders
+            self.loaded = True
+        if changed:
+            self.save()
+
+    def get(self, order_hash: str) -> str | None:
+        '''
+        Function to get the filename of the past order with the same items.
+
+            Parameters:
+                order_hash: hash of the order, (see get_order_hash()).
+
+            Returns:
+                str: filename of the past order, None if the order hasn't been added.
+        '''
+        if not self.loaded:
+            self.load()
+        return self.orders.get(order_hash)
+
+    def add(self, order_hash: str, filename: str, save=True) -> None:
+        '''
+        Function to add an order to the manifest.
+
+            Parameters:
+                order_hash: hash of the order, (see get_order_hash()).
+                filename: filename of the order in the folder.
+                save: write the manifest, (False when adding many orders, then call save()).
+        '''
+        if not self.loaded:
+            self.load()
+        with self.lock:
+            self.orders[order_hash] = filename
+        if save:
+            self.save()
+
+    def save(self) -> None:
+        '''
+        Function to write the manifest.
+        '''
+        with self.lock:
+            orders = dict(self.orders)
+        temp_filepath = get_temp_filepath(self.filepath)
+        with open(temp_filepath, 'w') as file:
+            json.dump(orders, file, indent=1)
+        os.replace(temp_filepath, self.filepath)
+
+    def get_past_order_path(self, filepath: str) -> str:
+        '''
+        Function to get where to copy an order in the folder, orders with the same name
+        but different items get a number, i.e: 'order (1).csv'.
+        '''
+        name, extension = os.path.splitext(os.path.basename(filepath))
+        path = os.path.join(self.folder, name + extension)
+        count = 1
+        while os.path.exists(path):
+            path = os.path.join(self.folder, f'{name} ({count}){extension}')
+            count += 1
+        return path
+
+
+# orders added to the inventory, (see OrderManifest).
+order_manifest = OrderManifest('Saved_Lists/Past Orders.json', 'Saved_Lists/Past Orders')
 
 
 def load_Items(self, order: list) -> None:
@@ -684,11 +2852,13 @@ def load_Items(self, order: list) -> None:
             order: list of items to load into the the dictionary
     '''
     self.Items.drop_all_items()
+    sections = []
     for items, section in zip(order, Items.get_sections()):
-        if len(order) > 0:
-            if not items.empty:
-                self.Items.add_item(items=items, section=section)
-                self.Items.remove_duplicates(section=section)
+        if not items.empty:
+            self.Items.add_item(items=items, section=section)
+            sections.append(section)
+    self.Items.flush()
+    self.Items.remove_duplicates(section=sections)
 
 
 if __name__ == "__main__":
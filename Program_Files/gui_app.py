@@ -4,7 +4,7 @@ Script to run PyQt app functions and classes.
 
 from PyQt5.QtWidgets import QMainWindow, QApplication
 from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import QUrl, QDir
+from PyQt5.QtCore import QUrl, QDir, Qt
 from PyQt5.QtGui import QDesktopServices, QIcon
 import pandas as pd
 import sys
@@ -16,6 +16,7 @@ from .add_item_window import Add_Item_Window
 from .project_window import Project_Window
 from .search_window import SearchWindow, open_search_window
 from .new_order_window import Order_Window
+from .workers import Inventory_Loader, Save_Worker, Reclassify_Worker
 
 from .gui_handling import (
     show_btns,
@@ -40,12 +41,27 @@ from .data_handling import (
     Inventory,
     labels,
     dict_keys,
-    load_Inventory,
     get_ordersheet,
+    save_order_categories,
     add_order_to_Inventory,
+    get_ordersheets,
+    add_orders_to_Inventory,
+    stream_ordersheet,
+    stream_order_bytes,
+    get_order_hash,
+    get_file_hash,
+    order_manifest,
     sort_order,
-    get_inventory,
+    category_rules,
+    save_Inventory,
+    inventory_exists,
     sort_by,
+    description_sort_tip,
+    inventory_storage,
+    inventory_files,
+    set_inventory_storage,
+    exports_stale_inventory,
+    export_inventory,
     load_Items
 )
 
@@ -88,6 +104,9 @@ class MainWindow(QMainWindow):
         self.sort_by = {key: True for key in labels}
         # keeping track of dynamically created project windows.
         self.project_windows = []
+        # if the inventory has been loaded, and functions waiting for it.
+        self.inventory_ready = False
+        self.inventory_waiting = []
 
         ''' Defining Widgets'''
 
@@ -121,6 +140,9 @@ class MainWindow(QMainWindow):
         self.action_open_past_orders = self.findChild(
             QtWidgets.QAction, 'actionOpen_Past_Orders'
         )
+        self.action_add_orders = self.findChild(
+            QtWidgets.QAction, 'actionAdd_Orders'
+        )
         self.action_open_inventory = self.findChild(
             QtWidgets.QAction, 'actionOpen_Inventory'
         )
@@ -142,12 +164,25 @@ class MainWindow(QMainWindow):
         self.action_create_project = self.findChild(
             QtWidgets.QAction, 'actionCreate_Project'
         )
+        self.action_classifier_profiling = self.findChild(
+            QtWidgets.QAction, 'actionClassifier_Profiling'
+        )
+        self.action_classifier_profile = self.findChild(
+            QtWidgets.QAction, 'actionClassifier_Profile'
+        )
+        self.action_reclassify_inventory = self.findChild(
+            QtWidgets.QAction, 'actionReclassify_Inventory'
+        )
+        self.action_sqlite_inventory = self.findChild(
+            QtWidgets.QAction, 'actionSQLite_Inventory'
+        )
 
         # Info Labels
         self.header_frame = self.findChild(QtWidgets.QFrame, 'header_frame')
         self.header = self.findChild(QtWidgets.QLabel, 'header')
         self.sub_header = self.findChild(QtWidgets.QLabel, 'sub_header')
         self.table = self.findChild(QtWidgets.QTableWidget, 'table')
+        self.statusbar = self.findChild(QtWidgets.QStatusBar, 'statusbar')
 
         # Buttons
         self.btn_save_list = self.findChild(
@@ -189,7 +224,9 @@ class MainWindow(QMainWindow):
         )
 
         # toolbar
-        self.action_search.triggered.connect(lambda: open_search_window(self))
+        self.action_search.triggered.connect(
+            lambda: self.when_inventory_ready(lambda: open_search_window(self))
+        )
         self.action_open_inventory.triggered.connect(self.open_inventory)
         self.action_open_order_window.triggered.connect(
             self.open_blank_new_order_window)
@@ -197,6 +234,7 @@ class MainWindow(QMainWindow):
         self.action_open_projects.triggered.connect(self.open_project_lists)
         self.action_create_project.triggered.connect(self.create_project)
         self.action_open_past_orders.triggered.connect(self.open_past_orders)
+        self.action_add_orders.triggered.connect(self.open_orders_to_add)
         self.action_export_file.triggered.connect(
             lambda: self.exporting(kind='file')
         )
@@ -209,6 +247,15 @@ class MainWindow(QMainWindow):
         self.action_import_folder.triggered.connect(
             lambda: self.importing(kind='dir')
         )
+        self.action_classifier_profiling.toggled.connect(
+            self.toggle_classifier_profiling)
+        self.action_classifier_profile.triggered.connect(
+            self.show_classifier_profile)
+        self.action_reclassify_inventory.triggered.connect(
+            self.reclassify_inventory)
+        self.action_sqlite_inventory.setChecked(inventory_storage == 'sqlite')
+        self.action_sqlite_inventory.toggled.connect(
+            self.toggle_inventory_storage)
 
         # Command Buttons
         self.btn_save_list.clicked.connect(self.save_list)
@@ -231,6 +278,8 @@ class MainWindow(QMainWindow):
         style_table(self)
         style_toolbar(self)
         style_menubar(self)
+        self.table.horizontalHeaderItem(
+            labels.index('Description')).setToolTip(description_sort_tip)
 
         # adding category to sorting comboBox and styling
         style_sorting_comboBox(self)
@@ -257,6 +306,40 @@ class MainWindow(QMainWindow):
                 '''
             )
 
+        # loading the inventory on a worker thread, actions using the
+        # inventory are disabled until it's loaded.
+        self.inventory_actions = [
+            self.action_search,
+            self.action_open_inventory,
+            self.action_open_order_window,
+            self.action_open_new_order,
+            self.action_open_past_orders,
+            self.action_add_orders,
+            self.action_reclassify_inventory
+        ]
+        toggled_widgets(self, widgets=self.inventory_actions, enable=False,
+                        toggle_sorting_frame=False, toggle_toolbar=False)
+        self.statusbar.showMessage('Loading inventory...')
+        self.inventory_loader = Inventory_Loader(self)
+        self.inventory_loader.loaded.connect(self.inventory_loaded)
+        self.inventory_loader.start()
+
+        # saving the inventory on a worker thread.
+        self.inventory_saver = Save_Worker(
+            Inventory.take_snapshot, self.write_inventory, self)
+        self.inventory_saver.saved.connect(
+            lambda message: self.statusbar.showMessage(message, 5000)
+        )
+        self.inventory_saver.failed.connect(self.inventory_save_failed)
+
+        # sorting the inventory with the current rules on a worker thread.
+        self.inventory_reclassifier = Reclassify_Worker(self)
+        self.inventory_reclassifier.classified.connect(
+            self.inventory_reclassified)
+        self.inventory_reclassifier.failed.connect(
+            lambda error: self.reclassify_done(f'Sorting inventory failed: {error}')
+        )
+
         self.show()  # showing window
 
     def closeEvent(self, event) -> None:
@@ -266,6 +349,11 @@ class MainWindow(QMainWindow):
             Parameters:
                 event: QtGui.QCloseEvent.
         '''
+        self.inventory_loader.wait()  # inventory could still be loading.
+        self.inventory_reclassifier.wait()  # inventory could still be sorting.
+        self.inventory_saver.wait_until_saved()  # inventory could still be saving.
+        if self.closing_save_failed(event):
+            return
 
         if self.editted_saved:  # inventory has been saved
             # closing children windows.
@@ -301,7 +389,9 @@ class MainWindow(QMainWindow):
             match user:
                 case QtWidgets.QMessageBox.Yes:
                     self.save_list()
-                    event.accept()
+                    self.inventory_saver.wait_until_saved()
+                    if not self.closing_save_failed(event):
+                        event.accept()
                 case QtWidgets.QMessageBox.No:
                     # user declines to save.
                     if self.order_window:
@@ -313,6 +403,26 @@ class MainWindow(QMainWindow):
                 case _:  # Cancel
                     event.ignore()
 
+    def closing_save_failed(self, event) -> bool:
+        '''
+        Function to keep the window open if saving the inventory failed, so the changes are not lost.
+
+            Parameters:
+                event: QtGui.QCloseEvent.
+
+            Returns:
+                True if saving failed.
+        '''
+        error = self.inventory_saver.take_error()
+        if error is None:
+            return False
+
+        event.ignore()
+        self.no_files_msg(title='EIP - Saving Inventory',
+                          header='Saving the inventory failed, the program was not closed.',
+                          text=error)
+        return True
+
     def contextMenuEvent(self, event) -> None:
         '''
         Function to show a menu when right clicked on item in the table.
@@ -420,6 +530,42 @@ class MainWindow(QMainWindow):
 
                 menu.exec_(event.globalPos())  # showing menu
 
+    def inventory_loaded(self, error: str) -> None:
+        '''
+        Function to enable the inventory actions once the inventory is loaded.
+            Triggered by the inventory loader's loaded signal.
+
+            Parameters:
+                error: error message if loading failed, empty otherwise.
+        '''
+        self.inventory_ready = True
+        toggled_widgets(self, widgets=self.inventory_actions, enable=True,
+                        toggle_sorting_frame=False, toggle_toolbar=False)
+
+        if error:
+            self.statusbar.showMessage(f'Failed to load inventory: {error}')
+        else:
+            self.statusbar.showMessage('Inventory loaded.', 5000)
+
+        # running the functions that were waiting for the inventory.
+        waiting = self.inventory_waiting
+        self.inventory_waiting = []
+        for function in waiting:
+            function()
+
+    def when_inventory_ready(self, function) -> None:
+        '''
+        Function to call a function once the inventory is loaded,
+        calls it right away if the inventory is already loaded.
+
+            Parameters:
+                function: function to call (no parameters).
+        '''
+        if self.inventory_ready:
+            function()
+        else:
+            self.inventory_waiting.append(function)
+
     def show_program_info(self) -> None:
         '''
         Function to show user the program info.
@@ -666,7 +812,13 @@ class MainWindow(QMainWindow):
                         while os.path.exists(destination_path):
                             destination_path = f'{base} ({count}){ext}'
                             count += 1
-                        shutil.copy2(file, destination_path)
+
+                        if exports_stale_inventory(file):
+                            # the inventory is in SQLite, so the excel file is written from it.
+                            self.when_inventory_ready(
+                                lambda path=destination_path: export_inventory(path))
+                        else:
+                            shutil.copy2(file, destination_path)
 
             case 'dir':  # folder is being exported.
 
@@ -692,17 +844,28 @@ class MainWindow(QMainWindow):
                         count += 1
                     shutil.copytree(exporting, destination_path)
 
+                    if exports_stale_inventory(exporting):
+                        # the inventory is in SQLite, so the excel file is written from it.
+                        inventory_path = os.path.join(destination_path, os.path.relpath(
+                            inventory_files['xlsx'], exporting))
+                        self.when_inventory_ready(
+                            lambda: export_inventory(inventory_path))
+
     def open_inventory(self) -> None:
         '''
         Function to open the inventory
         '''
-        if os.path.exists("Saved_Lists/Inventory.xlsx") or Inventory.check_if_empty():
+        if not self.inventory_ready:
+            self.when_inventory_ready(self.open_inventory)
+            return
+
+        if inventory_exists() or Inventory.check_if_empty():
             hide_btns(
                 self, [self.btn_save_list]
             )
             if not self.editted_saved:
                 self.btn_save_list.show()
-            self.is_sheet_open = "Saved_Lists/Inventory.xlsx"
+            self.is_sheet_open = Inventory.storage.filepath
             self.sub_header.setText('')
             self.header.setText('Looking at Inventory')
             fill_table(self, Inventory)
@@ -777,30 +940,15 @@ class MainWindow(QMainWindow):
 
     def save_list(self) -> None:
         '''
-        Function to save a list.
+        Function to save the inventory.
 
-        Parameters:
-            called_from: where the function was called from
+        The inventory is saved on a worker thread, the result is shown in the status bar.
         '''
         self.editted_saved = True
 
-        new_inventory = get_inventory()
-        with pd.ExcelWriter(f'Saved_Lists/Inventory.xlsx') as writer:
-            # Saves the new inventory as a spreadsheet, with each sheetname as the category name.
-            for cat in new_inventory.keys():
-                new_inventory[cat].save_toexcel(writer=writer)
-
-        # displays successfully save popup
-        msg = QtWidgets.QMessageBox()
-        msg.setWindowTitle('Inventory Saved Successfully')
-        pixmapi = getattr(QtWidgets.QStyle, "SP_DialogApplyButton")
-        icon = self.style().standardIcon(pixmapi)
-        msg.setWindowIcon(icon)
-        msg.setIcon(QtWidgets.QMessageBox.Information)
-        msg.setText(
-            'Inventory saved was successfully.')
-        msg.setStandardButtons(QtWidgets.QMessageBox.Ok)
-        _ = msg.exec_()
+        # Saves what changed in the inventory to the inventory file.
+        self.statusbar.showMessage('Saving inventory...')
+        self.inventory_saver.save()
 
         if self.order_window:
             if self.order_window.new_orders_added:
@@ -808,41 +956,192 @@ class MainWindow(QMainWindow):
 
         self.btn_save_list.hide()
 
-    def add_to_inventory(self, filename: str) -> None:
+    def write_inventory(self, data: Data) -> str:
+        '''
+        Function to write a snapshot of the inventory, (runs on the saver's worker thread).
+
+            Parameters:
+                data: snapshot of the inventory.
+
+            Returns:
+                message to show the user.
+        '''
+        rows, sections = save_Inventory(data)
+        return f'Inventory saved, wrote {rows} rows in {sections} changed categories.'
+
+    def inventory_save_failed(self, error: str, snapshot: Data) -> None:
+        '''
+        Function to handle a failed save.
+            Triggered by the inventory saver's failed signal.
+
+            Parameters:
+                error: error message.
+                snapshot: snapshot of the inventory that was not saved.
+        '''
+        Inventory.restore_changes(snapshot)
+        self.editted_saved = False
+        self.btn_save_list.show()
+        self.statusbar.showMessage(f'Saving inventory failed: {error}')
+
+    def add_to_inventory(self, filename: str, order_hash=None) -> None:
         '''
         Function to add an order to inventory.
             - Triggered by add_to_inventory button.
 
             Parameters:
                 filename: filename to order
+                order_hash: hash of the order if already known, (see get_order_hash()).
         '''
+        if not self.inventory_ready:
+            self.when_inventory_ready(lambda: self.add_to_inventory(filename, order_hash))
+            return
 
-        # checking if order has been added already.
-        past_order_path = 'Saved_Lists/Past Orders'
+        # checking if order has been added already, by its items (see OrderManifest).
         _, file = os.path.split(filename)
-
-        destination_full_path = os.path.join(past_order_path, file)
+        large_order = os.path.getsize(filename) > stream_order_bytes
+        if large_order:
+            if order_hash is None:
+                try:
+                    order_hash = get_file_hash(filename)
+                except (OSError, ValueError, KeyError) as error:
+                    self.order_read_failed(filename, error)
+                    return
+        else:
+            order = get_ordersheet(filename)
+            order_hash = get_order_hash(order)
+        past_order = order_manifest.get(order_hash)
 
         # if order has already been added.
-        if os.path.exists(destination_full_path):
+        if past_order is not None:
+            text = f'Order "{file}" has already been added to the inventory'
+            if past_order != file:
+                text += f' as "{past_order}"'
 
             popup_msg = QtWidgets.QMessageBox()
             popup_msg.setWindowTitle("EIP - Adding Order to Inventory")
-            popup_msg.setText(
-                f'Order "{file}" has already been added to the inventory.'
-            )
+            popup_msg.setText(text + '.')
             popup_msg.setIcon(QtWidgets.QMessageBox.Information)
 
             _ = popup_msg.exec_()
 
         else:  # if order has not been added.
-            # copying order to past order folder.
+            # adding the order to the inventory, large orders are read a part at a time.
+            if large_order:
+                if not self.stream_to_inventory(filename):
+                    return
+            else:
+                add_order_to_Inventory(order)
+
+            # copying order to past order folder, once it has been added.
+            destination_full_path = order_manifest.get_past_order_path(filename)
             shutil.copy2(filename, destination_full_path)
+            if not large_order:
+                save_order_categories(destination_full_path, order)
+            order_manifest.add(order_hash, os.path.basename(destination_full_path))
+            self.editted_saved = False
+
+    def open_orders_to_add(self) -> None:
+        '''
+        Function to pick orders to add to the inventory all at once.
+            - Triggered by the 'Add Orders to Inventory' action.
+        '''
+        downloads_path = os.path.expanduser("~" + os.sep + "Downloads")
+        filenames, _ = QtWidgets.QFileDialog.getOpenFileNames(
+            self, 'EIP - Adding Orders to Inventory', downloads_path, 'CSV Files (*.csv);; Excel Files (*.xlsx)')
+
+        if filenames:
+            self.add_orders_to_inventory(filenames)
+
+    def add_orders_to_inventory(self, filenames: list) -> None:
+        '''
+        Function to add many orders to inventory, the orders are read on multiple processes
+        and added at once (see get_ordersheets() and add_orders_to_Inventory()).
+
+            Parameters:
+                filenames: filenames to the orders
+        '''
+        if not self.inventory_ready:
+            self.when_inventory_ready(lambda: self.add_orders_to_inventory(filenames))
+            return
 
-            # adding the order to the inventory
-            order = get_ordersheet(destination_full_path)
-            add_order_to_Inventory(order)
+        # checking which orders have been added already, by their items (see OrderManifest).
+        filenames = [filename for filename in filenames if os.path.isfile(filename)]
+        added, new_orders = [], {}
+        for filename, order in zip(filenames, get_ordersheets(filenames)):
+            order_hash = get_order_hash(order)
+            if order_manifest.get(order_hash) is not None or order_hash in new_orders:
+                added.append(os.path.basename(filename))
+            else:
+                new_orders[order_hash] = (filename, order)
+
+        # copying the orders to past order folder and adding them to the inventory.
+        for order_hash, (filename, order) in new_orders.items():
+            destination_full_path = order_manifest.get_past_order_path(filename)
+            shutil.copy2(filename, destination_full_path)
+            save_order_categories(destination_full_path, order)
+            order_manifest.add(order_hash, os.path.basename(destination_full_path), save=False)
+        if new_orders:
+            add_orders_to_Inventory([order for _, order in new_orders.values()])
+            order_manifest.save()
             self.editted_saved = False
+            self.statusbar.showMessage(
+                f'Added {len(new_orders)} order(s) to the inventory.', 5000)
+
+        if added:
+            popup_msg = QtWidgets.QMessageBox()
+            popup_msg.setWindowTitle("EIP - Adding Orders to Inventory")
+            popup_msg.setText(
+                'These orders have already been added to the inventory:\n' + '\n'.join(added)
+            )
+            popup_msg.setIcon(QtWidgets.QMessageBox.Information)
+
+            _ = popup_msg.exec_()
+
+    def stream_to_inventory(self, filename: str) -> bool:
+        '''
+        Function to add a large order to inventory while showing how much of it has been read,
+        (see stream_ordersheet()).
+
+            Parameters:
+                filename: filename to order
+
+            Returns:
+                True if the order was added, nothing is added if reading it failed.
+        '''
+        progress_bar = QtWidgets.QProgressDialog(
+            f'Adding "{os.path.basename(filename)}" to the inventory...', None, 0, 100, self)
+        progress_bar.setWindowTitle("EIP - Adding Order to Inventory")
+        progress_bar.setWindowModality(Qt.WindowModal)
+        progress_bar.setMinimumDuration(0)
+        progress_bar.setValue(0)
+
+        def show_progress(rows: int, fraction: float) -> None:
+            progress_bar.setLabelText(f'Adding "{os.path.basename(filename)}" to the inventory...\n'
+                                      f'{rows:,} items read.')
+            progress_bar.setValue(int(fraction * 100))
+            QApplication.processEvents()
+
+        try:
+            stream_ordersheet(filename, progress=show_progress)
+        except (OSError, ValueError, KeyError) as error:
+            progress_bar.close()
+            self.order_read_failed(filename, error)
+            return False
+        progress_bar.close()
+        return True
+
+    def order_read_failed(self, filename: str, error: Exception) -> None:
+        '''
+        Function to tell the user an order could not be read, so it was not added.
+
+            Parameters:
+                filename: filename to order
+                error: error raised reading the order.
+        '''
+        self.no_files_msg(title='EIP - Adding Order to Inventory',
+                          header=f'Could not read "{os.path.basename(filename)}", '
+                                 'nothing was added to the inventory.',
+                          text=str(error))
 
     def create_project(self) -> None:
         '''
@@ -870,12 +1169,161 @@ class MainWindow(QMainWindow):
             project_window.show()
             self.project_windows.append(project_window)
 
+    def toggle_classifier_profiling(self, checked: bool) -> None:
+        '''
+        Function to turn profiling of the sorting rules on or off.
+
+            Parameters:
+                checked: True to start profiling.
+        '''
+        if checked:
+            category_rules.start_profiling()
+            self.statusbar.showMessage(
+                'Profiling sorting rules, items sorted from now on are recorded.', 5000)
+        else:
+            category_rules.stop_profiling()
+            self.statusbar.showMessage('Stopped profiling sorting rules.', 5000)
+
+    def toggle_inventory_storage(self, checked: bool) -> None:
+        '''
+        Function to choose where the inventory is stored, used the next time the program starts.
+
+            Parameters:
+                checked: True to store the inventory in SQLite, False in excel.
+        '''
+        if not self.inventory_ready:
+            self.when_inventory_ready(lambda: self.toggle_inventory_storage(checked))
+            return
+
+        storage = 'SQLite' if checked else 'excel'
+        try:
+            set_inventory_storage('sqlite' if checked else 'xlsx')
+        except (OSError, ValueError) as error:
+            self.statusbar.showMessage(f'Changing the inventory storage failed: {error}')
+            return
+        self.statusbar.showMessage(
+            f'The inventory will be stored in {storage} after restarting the program.')
+
+    def show_classifier_profile(self) -> None:
+        '''
+        Function to show the sorting rules profile, with the option to save it as json.
+        '''
+        profile = category_rules.get_profile()
+        if not profile:
+            self.no_files_msg(
+                title='Sorting Rules Profile',
+                header='Profiling is off.',
+                text='Turn on "Profile Sorting Rules" in the Tools menu, then open or import items.')
+            return
+
+        default = category_rules.categories[category_rules.default]
+        top_hits = '\n'.join(
+            f"{rule['hits']:>7}  {rule['rule']}" for rule in profile['rules'][:10])
+        slowest = sorted(profile['rules'], key=lambda rule: rule['seconds'], reverse=True)
+        top_seconds = '\n'.join(
+            f"{rule['seconds'] * 1000:>7.2f}ms  {rule['rule']}" for rule in slowest[:5])
+
+        msg = QtWidgets.QMessageBox(self)
+        msg.setWindowTitle('EIP - Sorting Rules Profile')
+        msg.setIcon(QtWidgets.QMessageBox.Information)
+        msg.setText(
+            f"{profile['items']} items sorted ({profile['descriptions']} different descriptions), "
+            f"{profile[default]['count']} went to {default}.")
+        msg.setInformativeText(
+            f'Most used rules:\n{top_hits}\n\nSlowest rules:\n{top_seconds}\n\n'
+            f"Word lookups: {profile['lookup_seconds'] * 1000:.2f}ms")
+        msg.setDetailedText(
+            f'Sample of descriptions sorted into {default}:\n'
+            + '\n'.join(profile[default]['samples']))
+        msg.setStandardButtons(
+            QtWidgets.QMessageBox.Save | QtWidgets.QMessageBox.Close)
+        msg.setDefaultButton(QtWidgets.QMessageBox.Close)
+
+        if msg.exec_() == QtWidgets.QMessageBox.Save:
+            save_filename, _ = QtWidgets.QFileDialog.getSaveFileName(
+                self,
+                'EIP - Save Sorting Rules Profile',
+                'Saved_Lists/sorting_profile.json',
+                'JSON (*.json)'
+            )
+            if save_filename:
+                category_rules.save_profile(save_filename)
+
+    def reclassify_inventory(self) -> None:
+        '''
+        Function to sort the inventory again with the current rules, (i.e: after the rules changed).
+
+        The rules are reloaded, then the items are sorted on a worker thread.
+        '''
+        if not self.inventory_ready:
+            self.when_inventory_ready(self.reclassify_inventory)
+            return
+
+        try:
+            category_rules.load()  # picking up changes to the rules.
+        except (OSError, ValueError, KeyError) as error:
+            self.no_files_msg(title='EIP - Sorting Rules',
+                              header='Could not load the sorting rules.',
+                              text=str(error))
+            return
+
+        self.action_reclassify_inventory.setEnabled(False)
+        self.statusbar.showMessage('Sorting inventory with the current rules...')
+        self.inventory_reclassifier.reclassify(Inventory)
+
+    def inventory_reclassified(self, categories: pd.Series) -> None:
+        '''
+        Function to move the inventory items to their new categories.
+            Triggered by the reclassifier's classified signal.
+
+            Parameters:
+                categories: Series of the position of each item's category, index are the row ids.
+        '''
+        try:
+            moves, combined = Inventory.reclassify(categories)
+        except ValueError as error:
+            self.reclassify_done(f'Sorting inventory failed: {error}')
+            return
+        if not moves:
+            self.reclassify_done('Inventory is already sorted with the current rules.')
+            return
+
+        self.editted_saved = False
+        if self.is_sheet_open == Inventory.storage.filepath:
+            self.open_inventory()  # showing the moved items.
+        self.reclassify_done(
+            f'Moved {sum(moves.values())} items, combined {combined} duplicates.')
+
+        msg = QtWidgets.QMessageBox(self)
+        msg.setWindowTitle('EIP - Re-sort Inventory')
+        msg.setIcon(QtWidgets.QMessageBox.Information)
+        msg.setText(
+            f'Moved {sum(moves.values())} items, combined {combined} duplicates.\n'
+            'Save the inventory to keep the changes.')
+        msg.setDetailedText('\n'.join(
+            f'{count:>7}  {from_section} -> {to_section}'
+            for (from_section, to_section), count in
+            sorted(moves.items(), key=lambda move: move[1], reverse=True)))
+        _ = msg.exec_()
+
+    def reclassify_done(self, message: str) -> None:
+        '''
+        Function to show the result of sorting the inventory and enable sorting again.
+
+            Parameters:
+                message: message to show in the status bar.
+        '''
+        self.action_reclassify_inventory.setEnabled(True)
+        self.statusbar.showMessage(message, 5000)
+
     def get_clicked_header(self, index):
         '''
         Function to get the header that was clicked on, then sort the table respectivitely.
         '''
         data = get_table_data(self)
-        data = sort_by(self, index, data)
+        # descriptions are only sorted by value when a single category is shown.
+        by_value = self.comboBox_section.currentText().lower() != 'all'
+        data = sort_by(self, index, data, by_value=by_value)
         fill_table(self, data)
 
     def add_to_project(self, row_index: int, action_index: int) -> None:
@@ -956,6 +1404,10 @@ class MainWindow(QMainWindow):
         Function to read user's input when adding an item manually.
             Triggered when btn "Add to ..." clicked.
         '''
+        if not self.inventory_ready:
+            self.when_inventory_ready(
+                lambda: self.receive_add_item_manually(item))
+            return
 
         items = sort_order(item)  # sorting item.
         add_order_to_Inventory(items)  # adding to inventory.
@@ -988,8 +1440,7 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == "__main__":
-    # runnning program
-    load_Inventory()
+    # runnning program, the inventory is loaded by the main window.
     app = QApplication(sys.argv)
     window1 = MainWindow()
     app.exec_()
@@ -192,37 +192,29 @@ def fill_table(self, dataframe: dict | pd.DataFrame | list | Data) -> None:
     elif type(dataframe) == list:
         items = pd.concat(dataframe)
     elif type(dataframe) == Data:
-        items = dataframe.to_dataframe()
+        items = dataframe.get_data()
     if items.empty:
         return
 
     count = items.shape[0]
     self.table.setRowCount(count)
 
-    for row in range(count):
-        self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(
-            items[labels[0]][row])
-        )
-
-        self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(
-            items[labels[1]].fillna('').astype(str)[row])
-        )
-
-        self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(
-            items[labels[2]].fillna('').astype(str)[row])
-        )
+    # converting each column to text once, rows are filled by position
+    # since the items can be a slice of a larger frame.
+    columns = [
+        items[labels[0]].tolist(),
+        items[labels[1]].fillna('').astype(str).tolist(),
+        items[labels[2]].fillna('').astype(str).tolist(),
+        items[labels[3]].fillna('').astype(str).tolist(),
+        items[labels[4]].astype(float).round(2).astype(str).tolist(),
+        items[labels[5]].astype(int).astype(str).tolist(),
+    ]
 
-        self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(
-            items[labels[3]].fillna('').astype(str)[row])
-        )
-
-        self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(
-            items[labels[4]].astype(float).round(2).astype(str)[row])
-        )
-
-        self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(
-            items[labels[5]].astype(int).astype(str)[row])
-        )
+    for row in range(count):
+        for col, column in enumerate(columns):
+            self.table.setItem(
+                row, col, QtWidgets.QTableWidgetItem(column[row])
+            )
 
     # Modifying styling for table and headers.
     header = self.table.horizontalHeader()
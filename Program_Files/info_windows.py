@@ -128,9 +128,7 @@ class Help_Window(QMainWindow):
         match help_section.lower():
 
             case 'welcome':
-                text = '''To properly handle XLSX (Excel) files, it is necessary for the user to remove the 'Subtotal' line from the sheet.
-
-This Electronics Inventory Management Program is a straightforward and efficient Python software designed to aid in the organization and management of electronic components. Its user-friendly interface allows users to easily import and read CSV (Comma-Separated Values) and XLSX (Excel) files that contain information about different electronic components. To successfully sort the parts, the program requires the following columns: 'Part Number', 'Manufacturer Part Number', 'Description', 'Customer Reference', 'Unit Price', and 'Quantity'. Any additional columns present in the data files will be skipped by the program.
+                text = '''This Electronics Inventory Management Program is a straightforward and efficient Python software designed to aid in the organization and management of electronic components. Its user-friendly interface allows users to easily import and read CSV (Comma-Separated Values) and XLSX (Excel) files that contain information about different electronic components. To successfully sort the parts, the program requires the following columns: 'Part Number', 'Manufacturer Part Number', 'Description', 'Customer Reference', 'Unit Price', and 'Quantity'. Any additional columns present in the data files will be skipped by the program.
 
 When the user interacts with the system by opening a new order, accessing their inventory, reviewing projects, or checking past orders, they will be presented with options to choose from to filter the electronics types in that particular file. Additionally, they can save orders for future reference. When a new order is added to the inventory, the program automatically organizes the items and places them in the appropriate sections. Subsequently, the user is prompted to save the edited inventory.'''
 
@@ -156,12 +154,15 @@ Commands are presented as various buttons and also drop-down menus when right-cl
 '''
 
             case 'orders':
-                text = '''If the order sheet is an Excel (xlsx) file, the subtotal line needs to manually removed before the program can read it. CSV files can be read either way.
+                text = '''Order sheets can be CSV or Excel (xlsx) files, the subtotal line is skipped when the order is read.
 
 When a user opens an order, they will have the option to add to the inventory.
 
 When an order is added to the inventory, it is saved in a subfolder called "Past Orders"
 for user reference and making sures orders are readded by mistake.
+Orders are recognized by their items, so a renamed or downloaded again copy of an order is not added twice.
+
+Many orders can be added at once with "Orders > Add Orders to Inventory...".
 '''
 
             case 'importing/exporting':
@@ -15,6 +15,12 @@ from .data_handling import (
     dict_keys,
     load_Inventory,
     get_ordersheet,
+    preview_ordersheet,
+    get_order_hash,
+    get_file_hash,
+    stream_order_bytes,
+    order_chunk_rows,
+    order_manifest,
     add_order_to_Inventory,
     sort_order,
     get_inventory,
@@ -52,6 +58,7 @@ class Order_Window(QMainWindow):
         self.move(800, 100)
 
         self.is_sheet_open = False
+        self.order_hash = None  # hash of the opened order, (see OrderManifest).
         self.opened_orders = []  # names of orders that have been opened.
         self.new_orders_added = []  # names of new orders that have been added.
         self.Items = Data(dict_keys)
@@ -223,19 +230,27 @@ class Order_Window(QMainWindow):
         '''
 
         self.is_sheet_open = filename
-        new_order = get_ordersheet(filename)
+        large_order = os.path.getsize(filename) > stream_order_bytes
+        if large_order:
+            # only the first items of large orders are shown, the order is streamed when added.
+            new_order = preview_ordersheet(filename)
+            self.order_hash = get_file_hash(filename)
+        else:
+            new_order = get_ordersheet(filename)
+            self.order_hash = get_order_hash(new_order)
         load_Items(self, new_order)
         fill_table(self, self.Items)
 
         # updating Qlabels
         name = filename.split("/")[-1]
         text = f'Order: {name}'
+        if large_order:
+            text += f' (first {order_chunk_rows:,} items)'
         self.header.setText(text)
         self.header_frame.show()
 
-        # checking if order has already been added
-        past_order_path = os.path.join('Saved_Lists/Past Orders', name)
-        if os.path.exists(past_order_path):
+        # checking if order has already been added, by its items (see OrderManifest).
+        if order_manifest.get(self.order_hash) is not None:
             self.btn_add_to_inventory.setText('Order Already Added')
             self.btn_add_to_inventory.setEnabled(False)
         else:
@@ -253,26 +268,10 @@ class Order_Window(QMainWindow):
 
         if filenames:
             self.opened_orders.clear()
+            # the subtotal line of csv and excel files is skipped when reading (see get_ordersheet()).
             for filename in filenames:
-                filetype = filename.split('.')[-1]
                 self.opened_orders.append(filename)
 
-                # checking if excel file
-                if filetype == 'xlsx':
-                    '''
-                    only needs a check for '.xlsx' files, since the program has a condition to remove the subtotal line from new order sheets.
-
-                    This may change at some time...
-                    '''
-                    user = QtWidgets.QMessageBox.question(
-                        self,
-                        'Opening an excel file', 'Make sure to that the subtotal line is removed from the excel file, otherwise the program will crash.\n\nWould you like to continue?',
-                        QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
-                        QtWidgets.QMessageBox.No
-                    )
-                    if user == QtWidgets.QMessageBox.No:
-                        return
-
             # loading first order
             filename = self.opened_orders[0]
             self.custom_fill_table(filename=filename)
@@ -335,7 +334,7 @@ class Order_Window(QMainWindow):
         '''
         Function to add order to inventory
         '''
-        self.parent().add_to_inventory(self.is_sheet_open)
+        self.parent().add_to_inventory(self.is_sheet_open, self.order_hash)
         self.parent().btn_save_list.show()
         self.new_orders_added.append(self.is_sheet_open)
         self.btn_add_to_inventory.setText('Order Already Added')
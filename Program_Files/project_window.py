@@ -21,6 +21,8 @@ from .data_handling import (
     get_ordersheet,
     sort_order,
     sort_by,
+    description_sort_tip,
+    save_list_file,
     Data
 )
 
@@ -50,6 +52,7 @@ from .styles import (
 
 from .info_windows import How_To_Use_Project_Window
 from .add_item_window import Add_Item_Window
+from .workers import Save_Worker
 
 
 class Project_Window(QMainWindow):
@@ -81,6 +84,14 @@ class Project_Window(QMainWindow):
         self.in_edit_mode = False  # if in edit mode.
         self.sort_by = {key: True for key in labels}
 
+        # saving the project on a worker thread.
+        self.project_saver = Save_Worker(
+            self.take_project_snapshot, self.write_project, self)
+        self.project_saver.saved.connect(
+            lambda message: self.statusBar().showMessage(message, 5000)
+        )
+        self.project_saver.failed.connect(self.project_save_failed)
+
         # display labels
         self.header = self.findChild(QtWidgets.QLabel, 'header')
         self.sub_header = self.findChild(QtWidgets.QLabel, 'sub_header')
@@ -188,6 +199,8 @@ class Project_Window(QMainWindow):
         style_table(self)
         style_toolbar(self)
         style_menubar(self)
+        self.table.horizontalHeaderItem(
+            labels.index('Description')).setToolTip(description_sort_tip)
 
         # labels in header frame.
         for label in [self.header, self.sub_header]:
@@ -207,6 +220,9 @@ class Project_Window(QMainWindow):
             Parameters:
                 event: QtGui.QCloseEvent.
         '''
+        self.project_saver.wait_until_saved()  # project could still be saving.
+        if self.closing_save_failed(event):
+            return
 
         if self.editted_saved:  # if editted project has been saved already.
             if self in self.parent().project_windows:
@@ -238,7 +254,9 @@ class Project_Window(QMainWindow):
                 case QtWidgets.QMessageBox.Yes:
                     # user accepts to save.
                     self.save_project()
-                    event.accept()
+                    self.project_saver.wait_until_saved()
+                    if not self.closing_save_failed(event):
+                        event.accept()
                 case QtWidgets.QMessageBox.No:
                     # user declines to save.
                     self.editted_saved = True
@@ -300,7 +318,7 @@ class Project_Window(QMainWindow):
             add_one_action.triggered.connect(
                 lambda: change_item_qty(
                     self,
-                    self.Project.data,
+                    self.Project,
                     row_index,
                     remove_all=None
                 )
@@ -308,7 +326,7 @@ class Project_Window(QMainWindow):
             remove_one_action.triggered.connect(
                 lambda: change_item_qty(
                     self,
-                    self.Project.data,
+                    self.Project,
                     row_index,
                     remove_all=False
                 )
@@ -316,7 +334,7 @@ class Project_Window(QMainWindow):
             delete_item_action.triggered.connect(
                 lambda: change_item_qty(
                     self,
-                    self.Project.data,
+                    self.Project,
                     row_index,
                     remove_all=True
                 )
@@ -462,10 +480,14 @@ class Project_Window(QMainWindow):
         if type(items) == pd.DataFrame:
             items = sort_order(items)
 
+        # adding every category first, so the project is only concatenated once.
+        sections = []
         for item, section in zip(items, self.Project.sections):
             if len(item) > 0:
                 self.Project.add_item(item, section)
-                self.Project.remove_duplicates(section)
+                sections.append(section)
+        self.Project.flush()
+        self.Project.remove_duplicates(sections)
         self.editted_saved = False
 
     def show_sorted_section(self, section: str) -> None:
@@ -506,28 +528,10 @@ class Project_Window(QMainWindow):
                 _ = msg.exec_()
                 return
 
-            filetype = self.is_sheet_open.split('.')[-1]
-            if filetype == 'csv':
-                data = self.Project.to_dataframe()
-                data.to_csv(self.is_sheet_open, index=False)
-            elif filetype == 'xlsx':
-                with pd.ExcelWriter(self.is_sheet_open) as writer:
-                    # Saves the new inventory as a spreadsheet, with each sheetname as the category name.
-                    for cat in self.Project.sections:
-                        self.Project.data[cat].save_toexcel(
-                            writer=writer, index=True)
+            # saving on a worker thread, the result is shown in the status bar.
             self.editted_saved = True
-
-            # showing pop up msg
-            msg = QtWidgets.QMessageBox()
-            msg.setWindowTitle('File Save Successful')
-            pixmapi = getattr(QtWidgets.QStyle, "SP_DialogApplyButton")
-            icon = self.style().standardIcon(pixmapi)
-            msg.setWindowIcon(icon)
-            msg.setIcon(QtWidgets.QMessageBox.Information)
-            msg.setText('Saving Project was successful!')
-            msg.setStandardButtons(QtWidgets.QMessageBox.Ok)
-            _ = msg.exec_()
+            self.statusBar().showMessage('Saving project...')
+            self.project_saver.save()
         else:
             # Pop up telling user project is
             msg = QtWidgets.QMessageBox()
@@ -543,6 +547,61 @@ class Project_Window(QMainWindow):
             msg.setStandardButtons(QtWidgets.QMessageBox.Ok)
             _ = msg.exec_()
 
+    def take_project_snapshot(self) -> tuple:
+        '''
+        Function to copy the project to save it, (see Save_Worker).
+
+            Returns:
+                tuple: filename, Data object.
+        '''
+        return self.is_sheet_open, self.Project.take_snapshot()
+
+    def write_project(self, snapshot: tuple) -> str:
+        '''
+        Function to write a copy of the project, (runs on the saver's worker thread).
+
+            Parameters:
+                snapshot: tuple of filename, Data object.
+
+            Returns:
+                message to show the user.
+        '''
+        filename, data = snapshot
+        save_list_file(filename, data)
+        return f'Project saved to {os.path.basename(filename)}.'
+
+    def project_save_failed(self, error: str, snapshot: tuple) -> None:
+        '''
+        Function to handle a failed save.
+            Triggered by the project saver's failed signal.
+
+            Parameters:
+                error: error message.
+                snapshot: tuple of filename, Data object that was not saved.
+        '''
+        self.editted_saved = False
+        self.statusBar().showMessage(f'Saving project failed: {error}')
+
+    def closing_save_failed(self, event) -> bool:
+        '''
+        Function to keep the window open if saving the project failed, so the changes are not lost.
+
+            Parameters:
+                event: QtGui.QCloseEvent.
+
+            Returns:
+                True if saving failed.
+        '''
+        error = self.project_saver.take_error()
+        if error is None:
+            return False
+
+        event.ignore()
+        self.no_files_msg(title='Electronics Inventory Program - Saving Project',
+                          header='Saving the project failed, the window was not closed.',
+                          text=error)
+        return True
+
     def edit_mode(self) -> None:
         '''
         Function to update the Project inventory when the table is in edit mode.
@@ -575,7 +634,7 @@ class Project_Window(QMainWindow):
             self.table.itemChanged.disconnect(self.get_editted)
             self.table.setEditTriggers(QtWidgets.QTableWidget.NoEditTriggers)
             self.table.itemChanged.connect(
-                lambda: update_subtotal(self, self.Project.data)
+                lambda: update_subtotal(self, self.Project)
             )
             toggled_widgets(self, enable=True, widgets=btns)
 
@@ -596,7 +655,7 @@ class Project_Window(QMainWindow):
             # updating project
             self.editted_saved = False
             self.Project.update_item(item=item)
-            update_subtotal(self, self.Project.data)
+            update_subtotal(self, self.Project)
 
     def add_to_project(self, item: pd.DataFrame) -> None:
         '''
@@ -625,7 +684,9 @@ class Project_Window(QMainWindow):
         '''
 
         data = get_table_data(self)
-        data = sort_by(self, index, data)
+        # descriptions are only sorted by value when a single category is shown.
+        by_value = self.comboBox_section.currentText().lower() != 'all'
+        data = sort_by(self, index, data, by_value=by_value)
         fill_table(self, data)
 
 
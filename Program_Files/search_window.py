@@ -13,9 +13,15 @@ import os
 from .data_handling import (
     Inventory,
     Items,
+    inventory_exists,
     dataframe_to_dict,
     get_ordersheet,
     sort_order,
+    KeywordMatcher,
+    get_item_words,
+    labels,
+    category_column,
+    description_columns,
 )
 
 from .gui_handling import (
@@ -227,8 +233,9 @@ class SearchWindow(QMainWindow):
             Returns:
                 DataFrame of items
         '''
-        if os.path.exists('Saved_Lists/Inventory.xlsx'):
-            return Inventory.to_dataframe()
+        if inventory_exists():
+            # keeping the category and description words, so the items are not sorted or split again.
+            return Inventory.get_data()[labels + description_columns + [category_column]]
         else:
             return pd.DataFrame()
 
@@ -324,9 +331,13 @@ class SearchWindow(QMainWindow):
         section, category, user_text = search_info
         user_text = user_text.lower().split(' ')
 
-        # checking the dataframe's 'Description' for each word in the string
-        results = [category_items[category_items['Description'].str.contains(
-            text, case=False)] for text in user_text]
+        # checking the dataframe's 'Description' for each word in the string,
+        # every word is found in a single scan of each description.
+        # items from the inventory and orders have their description words already lowercase,
+        # (see get_item_words()).
+        matches = KeywordMatcher(user_text).find_rows(
+            get_item_words(category_items), lowercase=True)
+        results = [category_items[rows] for rows in matches]
         results = pd.concat(results)
 
         # checking if the search result is empty
@@ -364,7 +375,7 @@ class SearchWindow(QMainWindow):
         # getting the section_items from the desired sections.
         match section.lower():
             case "inventory":
-                if os.path.exists('Saved_Lists/Inventory.xlsx'):
+                if inventory_exists():
                     section_items = self.get_inventory_items()
                 else:
                     title = 'No Inventory'
@@ -401,7 +412,7 @@ class SearchWindow(QMainWindow):
                     return
 
             case _:  # default searches all
-                inventory_items = Inventory.to_dataframe()
+                inventory_items = self.get_inventory_items()
                 project_items = self.get_project_items()
                 past_order_items = self.get_past_order_items()
 
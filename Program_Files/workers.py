@@ -0,0 +1,142 @@
+'''
+Script to run slow data handling tasks on worker threads.
+
+Each worker emits a signal when it is done, so the windows stay responsive.
+'''
+
+from PyQt5.QtCore import QThread, pyqtSignal
+import pandas as pd
+
+from .data_handling import load_Inventory, classify_parallel, words_column
+
+
+class Inventory_Loader(QThread):
+    '''
+    Class to load the inventory on a worker thread.
+
+    The Inventory must not be used until 'loaded' is emitted.
+    '''
+
+    # Signal sent when the inventory is loaded, (sends an error message if it failed).
+    loaded = pyqtSignal(str)
+
+    def run(self) -> None:
+        try:
+            load_Inventory()
+        except Exception as error:
+            self.loaded.emit(str(error))
+        else:
+            self.loaded.emit('')
+
+
+class Save_Worker(QThread):
+    '''
+    Class to save on a worker thread, so the window can still be used while saving.
+
+    A copy of what to save is taken on the GUI thread, then written on the worker thread.
+    Saves requested while saving are combined into one save once the current one is done.
+    '''
+
+    # Signals sent when saving is done, (sends the message to show the user,
+    # or the error and the copy that was not saved).
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str, object)
+
+    def __init__(self, take_snapshot, write, parent=None) -> None:
+        '''
+            Parameters:
+                take_snapshot: function to get a copy of what to save, (called on the GUI thread).
+                write: function to write the copy and return a message, (called on the worker thread).
+        '''
+        super(Save_Worker, self).__init__(parent)
+        self.take_snapshot = take_snapshot
+        self.write = write
+        self.snapshot = None  # copy being saved.
+        self.pending = False  # if a save was requested while saving.
+        self.error = None  # error of the last failed save, (see take_error()).
+        self.finished.connect(self.save_pending)
+
+    def save(self) -> None:
+        '''
+        Function to start saving, or to save again once the current save is done.
+        '''
+        if self.isRunning():
+            self.pending = True
+            return
+        self.snapshot = self.take_snapshot()
+        self.start()
+
+    def save_pending(self) -> None:
+        '''
+        Function to start the save that was requested while saving.
+            Triggered when the thread is finished.
+        '''
+        if self.pending:
+            self.pending = False
+            self.save()
+
+    def wait_until_saved(self) -> None:
+        '''
+        Function to block until every requested save is written, (used when closing).
+        '''
+        self.wait()
+        self.save_pending()
+        self.wait()
+
+    def take_error(self) -> str | None:
+        '''
+        Function to get the error of the last failed save and clear it, (used when closing,
+        since the 'failed' signal is only handled once the window is back in its event loop).
+
+            Returns:
+                error message, None if no save failed.
+        '''
+        error, self.error = self.error, None
+        return error
+
+    def run(self) -> None:
+        snapshot = self.snapshot
+        try:
+            message = self.write(snapshot)
+        except Exception as error:
+            self.error = str(error)
+            self.failed.emit(str(error), snapshot)
+        else:
+            self.saved.emit(message)
+
+
+class Reclassify_Worker(QThread):
+    '''
+    Class to sort items with the current rules on a worker thread, (see Data.reclassify()).
+
+    The descriptions are copied on the GUI thread, then the items are moved on the
+    GUI thread once 'classified' is emitted, since the data can change while sorting.
+    '''
+
+    # Signals sent when sorting is done, (sends the category positions indexed by row id).
+    classified = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None) -> None:
+        super(Reclassify_Worker, self).__init__(parent)
+        self.items = None  # copy of the descriptions being sorted.
+
+    def reclassify(self, data) -> None:
+        '''
+        Function to start sorting the items of a Data object, (ignored if already sorting).
+
+            Parameters:
+                data: Data object.
+        '''
+        if self.isRunning():
+            return
+        self.items = data.items[['Description', words_column]].copy()
+        self.start()
+
+    def run(self) -> None:
+        try:
+            categories = classify_parallel(self.items)
+        except Exception as error:
+            self.failed.emit(str(error))
+        else:
+            self.classified.emit(pd.Series(categories, index=self.items.index))
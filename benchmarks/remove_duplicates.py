@@ -0,0 +1,85 @@
+'''
+Benchmark of removing duplicate items: the original Category.remove_duplicates()
+against combine_duplicates() (see data_handling.py).
+
+The original makes about seven passes over the items (sort, two groupby transforms,
+drop_duplicates, reset_index, sort_values, reset_index), combine_duplicates() does
+a single groupby then takes the kept rows.
+
+Run from the program's folder: python -m benchmarks.remove_duplicates
+'''
+import time
+import numpy as np
+import pandas as pd
+
+from Program_Files.data_handling import labels, to_item_frame, combine_duplicates
+
+
+def original_remove_duplicates(items: pd.DataFrame, update_info=True) -> pd.DataFrame:
+    '''
+    Function to remove duplicates the way Category.remove_duplicates() used to.
+    '''
+    items = items.reset_index(drop=True)
+    items.sort_values(
+        [labels[0], 'Unit Price'], ascending=[True, False], inplace=True)
+
+    if update_info:
+        items['Quantity'] = items.groupby(
+            labels[0])['Quantity'].transform('sum')
+        items['Unit Price'] = items.groupby(
+            labels[0])['Unit Price'].transform('max')
+
+    items.drop_duplicates(subset=labels[0], keep='first', inplace=True)
+    items.reset_index(inplace=True)
+    items.sort_values('index', inplace=True)
+    items.reset_index(drop=True, inplace=True)
+    items.drop(columns=['index'], inplace=True)
+    return items
+
+
+def make_items(count: int, parts: int, seed=0) -> pd.DataFrame:
+    '''
+    Function to make random items, with 'parts' different part numbers.
+    Prices only have a few values so duplicates can have the same price.
+    '''
+    rng = np.random.default_rng(seed)
+    items = pd.DataFrame({
+        labels[0]: [f'{n}-ND' for n in rng.integers(0, parts, count)],
+        labels[1]: [f'MPN{n}' for n in range(count)],
+        labels[2]: [f'Description {n}' for n in range(count)],
+        labels[3]: '',
+        labels[4]: rng.integers(1, 20, count) / 4,
+        labels[5]: rng.integers(1, 100, count),
+    })
+    return to_item_frame(items)
+
+
+def best_time(function, repeat=5) -> float:
+    '''
+    Function to get the fastest time of running a function, in seconds.
+    '''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == '__main__':
+    print(f'{"items":>8} {"original":>10} {"single pass":>12} {"speed up":>9}')
+    for count in [1_000, 10_000, 100_000]:
+        items = make_items(count, parts=count // 4)
+
+        for update_info in [True, False]:
+            expected = original_remove_duplicates(items, update_info)
+            kept, _ = combine_duplicates(items, [labels[0]], update_info)
+            pd.testing.assert_frame_equal(
+                expected, kept.reset_index(drop=True))
+
+        original = best_time(lambda: original_remove_duplicates(items))
+        single_pass = best_time(
+            lambda: combine_duplicates(items, [labels[0]]))
+        print(f'{count:>8} {original:>9.4f}s {single_pass:>11.4f}s '
+              f'{original / single_pass:>8.1f}x')
+    print('Outputs are identical.')
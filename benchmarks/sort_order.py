@@ -0,0 +1,185 @@
+'''
+Benchmark of sorting items into categories: the original sort_order(), which
+checks one description at a time, against the current one (see data_handling.py).
+
+Run from the program's folder: python -m benchmarks.sort_order
+'''
+import time
+import numpy as np
+import pandas as pd
+
+from Program_Files.data_handling import sort_order
+
+
+def original_sort_order(order: pd.DataFrame) -> list:
+    '''
+    Function to sort an order the way sort_order() used to, one item at a time.
+    '''
+
+    # list of key description words to sorting items
+    ac_transformer_conds = ['AC/AC', 'AC Transformer', 'AC Trans']
+    pot_conds = ['potentiometer', 'pot']
+    acdc_conds = ['AC/DC', 'AC/DC Converter', 'ACDC']
+    fan_conds = ['fan', 'fans']
+    audio_conds = ['speaker', 'audio', 'mp3']
+    ics_conds = ['ics', 'ic']
+    diodes_conds = ['diode']
+    modules_conds = ['modules', 'module']
+    connectors_conds = ['conn', 'term', 'socket', 'receptacle']
+    capacitors_conds = ['cap', 'capacitor', 'capacitors']
+    resistors_conds = ['res', 'resistor', 'resistors']
+    leds_conds = ['leds', 'led', 'light']
+    transistors_conds = ['transistors', 'transistor', 'NPN', "PNP"]
+    inductors_conds = ['inductors', 'inductor', 'ind']
+    displays_conds = ['display', 'screen']
+    buttons_conds = ['button', 'switch', 'tact']
+    regulator_conds = ['reg', 'regulator']
+    resonator_conds = ['crystal', 'resonator']
+    encoder_conds = ['encoder']
+    relay_conds = ['relay']
+
+    # empty lists for parts to be added.
+    # if adding new sections, dont forget to add
+    ac_transformer, potentiometer = [], []
+    acdc, audio, fans = [], [], []
+    resistors, capacitors, inductors = [], [], []
+    transistors, diodes, ics = [], [], []
+    leds, connectors, buttons = [], [], []
+    displays, modules, other = [], [], []
+    regulator, logic_gates, resonators = [], [], []
+    encoders, relay = [], []
+
+    # THIS NEEDS TO BE IN THE SAME ORDER AS THE INVENTORY DICTIONARY!
+    # Otherwise when showing a category it will display an unintended one.
+    sections = [
+        resistors, capacitors, inductors, transistors,
+        diodes, regulator, ics, logic_gates, connectors, displays, buttons, leds,
+        audio, potentiometer, modules, fans, acdc, ac_transformer, resonators, encoders,
+        relay,
+        other
+    ]
+
+    # sorting the order into categories by checking if any words from
+    # the conditions are in the item description.
+    for i, descrip in enumerate(order['Description']):
+        line = descrip.lower().split()
+
+        if any(word.lower() in line for word in ac_transformer_conds):
+            ac_transformer.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in regulator_conds):
+            regulator.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in pot_conds):
+            potentiometer.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in acdc_conds):
+            acdc.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in fan_conds):
+            fans.append(order.iloc[i])
+
+        elif (
+            any(word.lower() in line for word in audio_conds) or
+            all(word.lower() in line for word in ['board', 'max9744'])
+        ):
+            audio.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in ics_conds):
+            if any(word.lower() in line for word in ['gate']):
+                logic_gates.append(order.iloc[i])
+            else:
+                ics.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in diodes_conds):
+            diodes.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in modules_conds):
+            modules.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in connectors_conds):
+            connectors.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in capacitors_conds):
+            capacitors.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in resistors_conds):
+            resistors.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in leds_conds):
+            leds.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in transistors_conds) and any('trans' in word for word in line):
+            transistors.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in inductors_conds):
+            inductors.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in displays_conds):
+            displays.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in buttons_conds):
+            buttons.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in resonator_conds):
+            resonators.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in encoder_conds):
+            encoders.append(order.iloc[i])
+
+        elif any(word.lower() in line for word in relay_conds):
+            relay.append(order.iloc[i])
+
+        else:  # left over
+            other.append(order.iloc[i])
+
+    # returning list of dataframe for each category.
+    return [pd.DataFrame(section) for section in sections]
+
+
+# words used to make random descriptions, including the special cases
+# (logic gates, max9744 boards, 'trans' in transistors, words with spaces).
+words = [
+    'RES', 'res', 'CAP', 'CER', '10UF', 'IC', 'ics', 'GATE', 'NAND', 'TRANS',
+    'NPN', 'pnp', 'TRANSISTOR', 'board', 'MAX9744', 'AMP', 'AC/AC', 'AC/DC',
+    'ACDC', 'AC', 'Transformer', 'FAN', 'speaker', 'MP3', 'DIODE', 'MODULE',
+    'CONN', 'TERM', 'SOCKET', 'LED', 'light', 'IND', 'INDUCTOR', 'DISPLAY',
+    'TACT', 'SWITCH', 'REG', 'POT', 'CRYSTAL', 'Resonator', 'ENCODER', 'RELAY',
+    'SMD', '0805', 'Ic,', 'res.'
+]
+
+
+def make_order(count: int, seed=0) -> pd.DataFrame:
+    '''
+    Function to make an order of random items.
+    '''
+    rng = np.random.default_rng(seed)
+    descriptions = [' '.join(rng.choice(words, size=size))
+                    for size in rng.integers(1, 7, count)]
+    return pd.DataFrame({
+        'Digi-Key Part #': [f'{n}-ND' for n in range(count)],
+        'Description': descriptions,
+        'Quantity': rng.integers(1, 100, count),
+        'Unit Price': rng.integers(1, 1000, count) / 100,
+    })
+
+
+if __name__ == '__main__':
+    print(f'{"items":>8} {"original":>10} {"vectorized":>11} {"speed up":>9}')
+    for count in [1_000, 10_000, 100_000]:
+        order = make_order(count)
+
+        start = time.perf_counter()
+        expected = original_sort_order(order)
+        original = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sections = sort_order(order)
+        vectorized = time.perf_counter() - start
+
+        for expected_section, section in zip(expected, sections):
+            pd.testing.assert_frame_equal(
+                expected_section, section, check_index_type=False)
+        print(f'{count:>8} {original:>9.3f}s {vectorized:>10.3f}s '
+              f'{original / vectorized:>8.1f}x')
+    print('Outputs are identical.')